@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import csv
+import hashlib
+import os
 from pathlib import Path
 from typing import Literal
 
@@ -7,6 +10,17 @@ import numpy as np
 import pandas as pd
 from pydantic import BaseModel, ConfigDict, Field as _Field
 
+try:
+    import pyarrow as _pa
+    import pyarrow.compute as _pc
+    import pyarrow.csv as _pacsv
+    import pyarrow.parquet as _pq
+except ImportError:  # JSON-mode installs (requirements.txt) do not ship pyarrow.
+    _pa = None
+    _pc = None
+    _pacsv = None
+    _pq = None
+
 
 def _to_camel(name: str) -> str:
     head, *tail = name.split("_")
@@ -25,6 +39,7 @@ class ProfileConfig(_CamelModel):
     quantiles: list[float] = _Field(default_factory=lambda: [0.0, 0.5, 0.9, 0.99, 1.0])
     max_unique_categorical: int = _Field(default=25, ge=2, le=200)
     top_correlations: int = _Field(default=10, ge=0, le=50)
+    engine: Literal["pandas", "polars"] = "pandas"
 
 
 class ValueCount(_CamelModel):
@@ -78,6 +93,7 @@ class DriftConfig(_CamelModel):
     numeric_mean_threshold: float = _Field(default=0.15, ge=0.0)
     categorical_l1_threshold: float = _Field(default=0.25, ge=0.0, le=1.0)
     top_k: int = _Field(default=5, ge=1, le=25)
+    engine: Literal["pandas", "polars"] = "pandas"
 
 
 class NumericDrift(_CamelModel):
@@ -136,35 +152,730 @@ def write_synthetic_events_csv(
     spend_usd_last_7d = base_spend * (sessions_last_7d + 1) / 4.0
 
     signup_days_ago = rng.integers(0, 365 * 2, size=rows)
-    signup_ts = pd.Timestamp("2025-01-01") - pd.to_timedelta(signup_days_ago, unit="D")
-    signup_date = pd.to_datetime(signup_ts).strftime("%Y-%m-%d")
-
-    churn_logit = (
-        -1.5
-        + 0.18 * support_tickets_last_30d
-        - 0.14 * sessions_last_7d
-        + rng.normal(0, 0.35, size=rows)
-        + drift * 0.25
-    )
-    churn_prob = 1.0 / (1.0 + np.exp(-churn_logit))
+    # Day arithmetic and ISO formatting on datetime64[D] stay in numpy's C loops;
+    # no per-row Timestamp/strftime round-trip.
+    signup_days = np.datetime64("2025-01-01", "D") - signup_days_ago.astype("timedelta64[D]")
+    signup_date = np.datetime_as_string(signup_days, unit="D")
+
+    # churn_prob = 1 / (1 + exp(-logit)), with
+    # logit = -1.5 + 0.18 * tickets - 0.14 * sessions + noise + drift * 0.25,
+    # evaluated in place in one buffer (same operation order, so the same values)
+    # instead of allocating a temporary per operator.
+    churn_prob = np.multiply(support_tickets_last_30d, 0.18)
+    churn_prob += -1.5
+    churn_prob -= np.multiply(sessions_last_7d, 0.14)
+    churn_prob += rng.normal(0, 0.35, size=rows)
+    churn_prob += drift * 0.25
+    np.negative(churn_prob, out=churn_prob)
+    np.exp(churn_prob, out=churn_prob)
+    churn_prob += 1.0
+    np.divide(1.0, churn_prob, out=churn_prob)
     churned = rng.random(size=rows) < churn_prob
 
+    # Every array above already has its final dtype (int64, <U2, float64, bool), so
+    # the frame wraps them as-is instead of copying each through astype().
     df = pd.DataFrame(
         {
-            "user_id": user_id.astype(int),
-            "country": country.astype(str),
+            "user_id": user_id,
+            "country": country,
             "signup_date": signup_date,
-            "sessions_last_7d": sessions_last_7d.astype(int),
-            "support_tickets_last_30d": support_tickets_last_30d.astype(int),
-            "spend_usd_last_7d": spend_usd_last_7d.astype(float),
-            "churned": churned.astype(bool),
-        }
+            "sessions_last_7d": sessions_last_7d,
+            "support_tickets_last_30d": support_tickets_last_30d,
+            "spend_usd_last_7d": spend_usd_last_7d,
+            "churned": churned,
+        },
+        copy=False,
     )
 
-    df.to_csv(out_path, index=False)
+    if _pacsv is None:
+        df.to_csv(out_path, index=False)
+    else:
+        # Why: Arrow formats and writes cells in C++ without building a Python string
+        # per cell. The header is written by hand because Arrow always quotes it;
+        # with unquoted cells the file matches `to_csv`'s apart from bools, written
+        # as true/false, which both CSV readers parse back to bools.
+        with open(out_path, "wb") as fh:
+            fh.write((",".join(df.columns) + "\n").encode())
+            _pacsv.write_csv(
+                _pa.Table.from_pandas(df, preserve_index=False),
+                fh,
+                write_options=_pacsv.WriteOptions(
+                    include_header=False, batch_size=1 << 16, quoting_style="none"
+                ),
+            )
     return str(out_path)
 
 
+# The cells `pd.read_csv` reads as missing by default. Arrow's and Polars' defaults
+# differ ("None" and "<NA>", resp. everything but the empty cell), so both are given
+# this list.
+_PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+
+def _read_csv(path: str, columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    Load a CSV into a numpy-backed DataFrame, optionally only the given `columns`
+    (which must exist), in that order.
+
+    Why: pyarrow parses on multiple C++ threads without building per-cell Python
+    objects, which makes ingest several times faster than `pd.read_csv`. Arrow's
+    inference is mapped back to `pd.read_csv`'s: date/time/timestamp text stays
+    text (object) and all-empty columns are float64, so the profile output is
+    unchanged. Unrequested columns are skipped during parsing and files are
+    memory-mapped. Falls back to pandas when pyarrow is absent or cannot read the
+    file as pandas does (see `_read_csv_arrow`).
+    """
+
+    table = None if _pacsv is None else _read_csv_arrow(path, columns or [])
+    if table is None:
+        return _read_csv_pandas(path, columns)
+    return _arrow_to_pandas(table)
+
+
+def _read_csv_pandas(path: str, columns: list[str] | None = None) -> pd.DataFrame:
+    """`_read_csv` without Arrow."""
+
+    if columns is None:
+        return pd.read_csv(path)
+    return pd.read_csv(path, usecols=columns)[columns]
+
+
+def _read_csv_arrow(path: str, columns: list[str]) -> "_pa.Table | None":
+    """
+    Parse `columns` (all when empty) into an Arrow table typed as pandas would type it.
+
+    Returns None for files Arrow cannot read the way `pd.read_csv` does: ragged rows
+    (an error in Arrow, NaN-padded in pandas), duplicate or empty header names
+    (renamed `a.1` / `Unnamed: 1` by pandas) and integers beyond int64 (uint64 in
+    pandas, double in Arrow).
+    """
+
+    if not _plain_csv_header(path):
+        return None
+    try:
+        table = _parse_csv_arrow(path, columns)
+        # Arrow infers date/time/timestamp types from ISO-looking text; pandas does
+        # not. Dates are only inferred from strict YYYY-MM-DD text, which a cast in
+        # `_as_read_csv_types` restores. Other formats vary, so those columns are
+        # re-parsed as strings instead.
+        temporal = _non_date_temporal(table.schema)
+        if temporal:
+            text = _parse_csv_arrow(path, temporal, dict.fromkeys(temporal, _pa.string()))
+            for name in temporal:
+                table = table.set_column(table.schema.get_field_index(name), name, text[name])
+    except _pa.ArrowInvalid:
+        return None
+    return _as_read_csv_types(table)
+
+
+def _non_date_temporal(schema: "_pa.Schema") -> list[str]:
+    """Columns Arrow typed as times or timestamps, which pandas leaves as text."""
+
+    return [
+        f.name for f in schema if _pa.types.is_temporal(f.type) and not _pa.types.is_date32(f.type)
+    ]
+
+
+def _as_read_csv_types(table: "_pa.Table") -> "_pa.Table | None":
+    """Map the date, null and float columns Arrow inferred to `pd.read_csv`'s types."""
+
+    for i, field in enumerate(table.schema):
+        if _pa.types.is_date32(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(_pa.string()))
+        elif _pa.types.is_floating(field.type):
+            top = _pc.max(_pc.abs(table.column(i))).as_py()
+            if top is not None and 2**63 <= top < float("inf"):
+                return None
+        elif _pa.types.is_null(field.type):
+            # pandas reads all-empty columns as float64, and header-only files as object.
+            type_ = _pa.float64() if table.num_rows else _pa.string()
+            table = table.set_column(i, field.name, _pa.nulls(table.num_rows, type_))
+    return table
+
+
+def _plain_csv_header(path: str) -> bool:
+    """Whether every header name of a CSV is non-empty and unique, so pandas keeps it as-is."""
+
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as fh:
+        header = next(csv.reader(fh), [])
+    return all(header) and len(set(header)) == len(header)
+
+
+def _parse_csv_arrow(
+    path: str, columns: list[str], column_types: dict | None = None
+) -> "_pa.Table":
+    """Parse `columns` (all when empty) of a CSV with pyarrow's threaded reader."""
+
+    read_options, convert_options = _csv_arrow_options(columns, column_types)
+    with _pa.memory_map(path, "r") as source:
+        return _pacsv.read_csv(source, read_options=read_options, convert_options=convert_options)
+
+
+def _csv_arrow_options(columns: list[str], column_types: dict | None = None):
+    """Arrow read/convert options matching `pd.read_csv`'s defaults."""
+
+    convert_options = _pacsv.ConvertOptions(
+        # Why: match pandas, which treats empty/"NA"-style cells as missing in
+        # string columns too.
+        strings_can_be_null=True,
+        null_values=_PANDAS_NA_VALUES,
+        include_columns=columns,
+        column_types=column_types,
+    )
+    read_options = _pacsv.ReadOptions(block_size=8 << 20, use_threads=True)
+    return read_options, convert_options
+
+
+def _arrow_to_pandas(table: "_pa.Table", rows: np.ndarray | None = None) -> pd.DataFrame:
+    """
+    Convert a table from `_read_csv_arrow` (only the `rows` positions, if given) with
+    the dtypes `pd.read_csv` gives the whole file.
+
+    Dtypes are decided from the whole table, so a gap outside `rows` still makes an
+    integer column float64 and a bool column object.
+    """
+
+    gappy = {f.name: f.type for f in table.schema if table.column(f.name).null_count}
+    if rows is not None:
+        table = table.take(rows)
+    df = table.to_pandas(self_destruct=True)
+    for name, type_ in gappy.items():
+        if _pa.types.is_integer(type_):
+            df[name] = df[name].astype(np.float64)
+        elif _pa.types.is_string(type_) or _pa.types.is_boolean(type_):
+            # These convert to object arrays holding None; pandas marks the gaps NaN.
+            values = df[name].to_numpy(dtype=object, copy=True)
+            values[pd.isna(values)] = np.nan
+            df[name] = values
+    return df
+
+
+def _cache_dir() -> Path:
+    """
+    Directory owned by the living app for its parsed-CSV cache: `$LIVING_APP_CACHE_DIR`,
+    else `tywrap-living-app` under `$XDG_CACHE_HOME` (default `~/.cache`).
+    """
+
+    override = os.environ.get("LIVING_APP_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "tywrap-living-app"
+
+
+# Schema metadata entry holding the key of the CSV a cache file was built from.
+_CACHE_KEY_FIELD = b"living_app.csv_key"
+
+# Total size the cache directory is trimmed to after each write, least recently
+# used entries first.
+_CACHE_MAX_BYTES = 2 << 30
+
+
+def _csv_stat_key(path: str) -> bytes:
+    """`size:mtime_ns` of a CSV, the cheap prefix of `_csv_cache_key`."""
+
+    st = os.stat(path)
+    return f"{st.st_size}:{st.st_mtime_ns}".encode()
+
+
+def _csv_cache_key(path: str, stat_key: bytes) -> bytes:
+    """`size:mtime_ns:sha256` of a CSV; any rewrite changes it, even within one mtime tick."""
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while block := fh.read(8 << 20):
+            digest.update(block)
+    return stat_key + b":" + digest.hexdigest().encode()
+
+
+def _cache_file(path: str) -> Path:
+    """The cache file of a CSV, one per absolute path, so a rewrite replaces its entry."""
+
+    name = hashlib.sha256(os.path.realpath(path).encode()).hexdigest()[:32]
+    return _cache_dir() / f"{name}.parquet"
+
+
+def _open_csv_cache(path: str):
+    """
+    The cache of `path` as a `ParquetFile` if it was built from the CSV as it is now.
+
+    The CSV is only hashed when an entry exists and its size and mtime still match.
+    """
+
+    file = _cache_file(path)
+    try:
+        cache = _pq.ParquetFile(file)
+    except (OSError, _pa.ArrowInvalid):
+        return None
+    stored = (cache.schema_arrow.metadata or {}).get(_CACHE_KEY_FIELD, b"")
+    stat_key = _csv_stat_key(path)
+    if not stored.startswith(stat_key + b":") or stored != _csv_cache_key(path, stat_key):
+        return None
+    try:
+        os.utime(file)  # marks the entry as recently used for `_trim_cache`
+    except OSError:
+        pass
+    return cache
+
+
+def _write_csv_cache(path: str, key: bytes, table: "_pa.Table") -> None:
+    """Best-effort write of the cache; a failure only costs the next parse."""
+
+    cache = _cache_file(path)
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        metadata = {**(table.schema.metadata or {}), _CACHE_KEY_FIELD: key}
+        _pq.write_table(table.replace_schema_metadata(metadata), tmp, compression="zstd")
+        # Atomic rename so concurrent readers never see a partial file.
+        os.replace(tmp, cache)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        return
+    _trim_cache(cache.parent, keep=cache)
+
+
+def _trim_cache(directory: Path, keep: Path) -> None:
+    """Delete the least recently used entries until the cache fits `_CACHE_MAX_BYTES`."""
+
+    entries = []
+    for entry in directory.glob("*.parquet"):
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime_ns, st.st_size, entry))
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda e: e[0]):
+        if total <= _CACHE_MAX_BYTES:
+            break
+        if entry != keep:
+            entry.unlink(missing_ok=True)
+            total -= size
+
+
+def _load_csv_table(path: str, columns: list[str] | None = None) -> "_pa.Table | None":
+    """
+    `_read_csv_arrow` backed by a Parquet cache in `_cache_dir()`.
+
+    The cache holds the Arrow table before its conversion to pandas, so cached and
+    parsed loads go through the same `_arrow_to_pandas` and produce the same frames.
+    It is keyed on the CSV's size, mtime and content hash. A full parse writes it;
+    projected parses neither write nor hash. Returns None, caching nothing, for files
+    only pandas reads correctly.
+    """
+
+    cache = _open_csv_cache(path)
+    if cache is not None:
+        return cache.read(columns=columns)
+    if columns is not None:
+        return _read_csv_arrow(path, columns)
+    # Keyed before parsing: a rewrite during the parse then misses on the next load.
+    key = _csv_cache_key(path, _csv_stat_key(path))
+    table = _read_csv_arrow(path, [])
+    if table is not None:
+        _write_csv_cache(path, key, table)
+    return table
+
+
+def _load_csv(path: str, columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    `_read_csv` backed by the parsed-CSV cache when pyarrow is installed.
+
+    Why: the living app re-profiles the same files repeatedly, and reading Parquet
+    is far cheaper than parsing CSV.
+    """
+
+    table = None if _pacsv is None else _load_csv_table(path, columns)
+    if table is None:
+        return _read_csv_pandas(path, columns)
+    return _arrow_to_pandas(table)
+
+
+class _ArrowCsvMismatch(Exception):
+    """Arrow cannot stream a CSV the way `pd.read_csv` reads it."""
+
+
+def _iter_csv_chunks(path: str, columns: list[str], chunksize: int, *, arrow: bool = True):
+    """
+    Yield `columns` of a CSV as DataFrames of at most `chunksize` rows, typed per chunk
+    as `pd.read_csv` types them. Uses the parsed-CSV cache when there is one, else
+    streams the file through Arrow when `arrow` is set and pyarrow is installed.
+
+    The Arrow stream fixes column types from its first block, so it raises
+    `_ArrowCsvMismatch` partway through files whose later rows pandas types
+    differently; callers then restart with `arrow=False`.
+    """
+
+    if arrow and _pq is not None:
+        cache = _open_csv_cache(path)
+        if cache is not None:
+            for batch in cache.iter_batches(batch_size=chunksize, columns=columns):
+                yield _arrow_to_pandas(_pa.Table.from_batches([batch]))
+            return
+    if arrow and _pacsv is not None and _plain_csv_header(path):
+        yield from _iter_csv_chunks_arrow(path, columns, chunksize)
+        return
+    # Why: round_trip parses floats correctly rounded, like Arrow does, so means agree
+    # to the last bit whichever reader produced the chunks.
+    yield from pd.read_csv(
+        path, usecols=columns, chunksize=chunksize, float_precision="round_trip"
+    )
+
+
+def _iter_csv_chunks_arrow(path: str, columns: list[str], chunksize: int):
+    """
+    `_iter_csv_chunks` on pyarrow's streaming CSV reader.
+
+    Why: the stream parses blocks on C++ threads without building a Python object per
+    cell, and holds only about one chunk of rows. Its batches are regrouped into
+    exactly `chunksize` rows, so means are summed over the same chunks as pandas'.
+    """
+
+    try:
+        reader = _open_csv_stream(path, columns)
+        temporal = _non_date_temporal(reader.schema)
+        if temporal:
+            # Times and timestamps stay text, as in `_read_csv_arrow`.
+            reader.close()
+            reader = _open_csv_stream(path, columns, dict.fromkeys(temporal, _pa.string()))
+        with reader:
+            pending: list = []
+            rows = 0
+            for batch in reader:
+                pending.append(batch)
+                rows += batch.num_rows
+                while rows >= chunksize:
+                    table = _pa.Table.from_batches(pending, schema=reader.schema)
+                    yield _arrow_chunk_to_pandas(table.slice(0, chunksize))
+                    rest = table.slice(chunksize)
+                    pending, rows = rest.to_batches(), rest.num_rows
+            if rows:
+                yield _arrow_chunk_to_pandas(_pa.Table.from_batches(pending, schema=reader.schema))
+    except _pa.ArrowInvalid as exc:
+        raise _ArrowCsvMismatch(str(exc)) from exc
+
+
+def _open_csv_stream(path: str, columns: list[str], column_types: dict | None = None):
+    """Open `columns` of a CSV as a stream of Arrow record batches."""
+
+    read_options, convert_options = _csv_arrow_options(columns, column_types)
+    return _pacsv.open_csv(path, read_options=read_options, convert_options=convert_options)
+
+
+def _arrow_chunk_to_pandas(table: "_pa.Table") -> pd.DataFrame:
+    """`_arrow_to_pandas` for one streamed chunk, whose types are not yet pandas'."""
+
+    table = _as_read_csv_types(table)
+    if table is None:
+        raise _ArrowCsvMismatch("integers beyond int64")
+    return _arrow_to_pandas(table)
+
+
+def _read_csv_sample(path: str, n: int) -> pd.DataFrame:
+    """
+    Equivalent of `_read_csv(path).sample(n=n, random_state=0)`.
+
+    Why: the whole file is still parsed (or loaded from the cache), so column dtypes
+    come from every row exactly as in a full read, but only the sampled rows are
+    converted to pandas; the text cells of the other rows never become Python strings.
+    The row positions are drawn exactly as `DataFrame.sample` draws them. Without
+    pyarrow (or for files only pandas reads) this is the full read and the sample.
+    """
+
+    table = None if _pacsv is None else _load_csv_table(path)
+    if table is None:
+        df = _read_csv_pandas(path)
+        return df.sample(n=n, random_state=0) if len(df) > n else df
+    if table.num_rows <= n:
+        return _arrow_to_pandas(table)
+    positions = np.random.RandomState(0).choice(table.num_rows, size=n, replace=False)
+    df = _arrow_to_pandas(table, positions)
+    df.index = positions
+    return df
+
+
+def _is_text_like(series: pd.Series) -> bool:
+    """True for object columns and pandas' dedicated string dtypes."""
+
+    return pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+
+
+def _column_kind(dtype: object) -> Literal["numeric", "categorical", "other"]:
+    """
+    Classify a column by dtype alone: numeric (not bool), categorical candidate
+    (object/string/bool), or other (datetimes, etc.).
+    """
+
+    if pd.api.types.is_bool_dtype(dtype):
+        return "categorical"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numeric"
+    if getattr(dtype, "kind", None) == "O":
+        return "categorical"
+    return "other"
+
+
+def _numeric_summary(
+    values: np.ndarray, *, count: int, missing: int, quantiles: list[float]
+) -> NumericSummary:
+    """
+    Summarize the non-missing float values of one numeric column.
+
+    Why: a single `np.quantile` call sorts the column once for every requested
+    quantile. min/max are still taken with `min()`/`max()`: with infinite values the
+    0.0/1.0 quantiles interpolate to NaN.
+    """
+
+    if values.size == 0:
+        return NumericSummary.model_construct(
+            count=count, missing=missing, mean=None, std=None, min=None, max=None, quantiles={}
+        )
+    qs = np.quantile(values, quantiles)
+    by_q = {q: float(v) for q, v in zip(quantiles, qs)}
+    return NumericSummary.model_construct(
+        count=count,
+        missing=missing,
+        mean=float(values.mean()),
+        std=float(values.std(ddof=1)) if values.size > 1 else None,
+        min=float(values.min()),
+        max=float(values.max()),
+        quantiles={str(q): v for q, v in by_q.items()},
+    )
+
+
+def _numeric_summaries(
+    numeric: np.ndarray, *, missing: list[int], quantiles: list[float]
+) -> list[NumericSummary]:
+    """
+    Summaries for every column of a float64 matrix (NaN = missing).
+
+    Why: columns without missing values (the common case) are summarized together,
+    with one `np.quantile`/`mean`/`std` call across all of them instead of a round of
+    calls per column. The block is column-major so each column still reduces over
+    contiguous memory, giving the same results as the per-column path, which the
+    columns with gaps still take.
+    """
+
+    rows = numeric.shape[0]
+    complete = np.flatnonzero(~np.isnan(numeric).any(axis=0)) if rows else np.array([], int)
+    summaries: dict[int, NumericSummary] = {}
+    if complete.size:
+        block = np.asfortranarray(numeric[:, complete])
+        qs = np.quantile(block, quantiles, axis=0)
+        means = block.mean(axis=0)
+        stds = block.std(axis=0, ddof=1) if rows > 1 else None
+        mins = block.min(axis=0)
+        maxs = block.max(axis=0)
+        for pos, col in enumerate(complete):
+            by_q = {q: float(v) for q, v in zip(quantiles, qs[:, pos])}
+            summaries[int(col)] = NumericSummary.model_construct(
+                count=rows,
+                missing=int(missing[col]),
+                mean=float(means[pos]),
+                std=float(stds[pos]) if stds is not None else None,
+                min=float(mins[pos]),
+                max=float(maxs[pos]),
+                quantiles={str(q): v for q, v in by_q.items()},
+            )
+    return [
+        summaries[col]
+        if col in summaries
+        else _numeric_summary(
+            numeric[:, col][~np.isnan(numeric[:, col])],
+            count=rows,
+            missing=int(missing[col]),
+            quantiles=quantiles,
+        )
+        for col in range(numeric.shape[1])
+    ]
+
+
+def _pairwise_pearson_upper(
+    arr: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pearson coefficients for the strict upper triangle of the column pairs of `arr`.
+
+    Matches `DataFrame.corr()` (pairwise-complete observations) but computes every
+    pairwise moment with a handful of BLAS-backed matrix products instead of pandas'
+    per-pair loop. Columns are centered first so the raw-moment formula stays
+    numerically stable. Pairs without a defined coefficient are dropped.
+    """
+
+    mask = ~np.isnan(arr)
+    m = mask.astype(np.float64)
+    counts = mask.sum(axis=0)
+    means = np.where(counts > 0, np.nansum(arr, axis=0) / np.maximum(counts, 1), 0.0)
+    x = np.where(mask, arr - means, 0.0)
+
+    n = m.T @ m
+    sx = x.T @ m  # sum of column i over rows where column j is present
+    sxx = (x * x).T @ m
+    sxy = x.T @ x
+
+    iu, ju = np.triu_indices(arr.shape[1], k=1)
+    n_ij = n[iu, ju]
+    sx_i, sx_j = sx[iu, ju], sx[ju, iu]
+    cov = n_ij * sxy[iu, ju] - sx_i * sx_j
+    var_i = n_ij * sxx[iu, ju] - sx_i * sx_i
+    var_j = n_ij * sxx[ju, iu] - sx_j * sx_j
+    denom = np.sqrt(var_i * var_j)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vals = np.clip(cov / denom, -1.0, 1.0)
+    keep = (n_ij >= 2) & (var_i > 0) & (var_j > 0) & np.isfinite(vals)
+    return iu[keep], ju[keep], vals[keep]
+
+
+def _import_polars():
+    """
+    Return the `polars` module, or None when it is not installed.
+
+    Why: Polars is an opt-in engine (`engine="polars"`); the pandas path remains the
+    fallback so configs requesting it still work on installs without it.
+    """
+
+    try:
+        import polars as pl
+    except ImportError:
+        return None
+    return pl
+
+
+def _top_correlations(numeric: np.ndarray, names: list[str], limit: int) -> list[Correlation]:
+    """Strongest pairwise correlations between the columns of a float64 matrix."""
+
+    if limit <= 0 or len(names) < 2:
+        return []
+    iu, ju, vals = _pairwise_pearson_upper(numeric)
+    mag = np.abs(vals)
+    k = min(limit, mag.size)
+    if k < mag.size:
+        # Select the k strongest pairs in O(P), then order just those. Pairs tied with
+        # the k-th magnitude are taken lowest index first, as a full stable sort would.
+        cutoff = np.partition(mag, mag.size - k)[mag.size - k]
+        above = np.flatnonzero(mag > cutoff)
+        ties = np.flatnonzero(mag == cutoff)[: k - above.size]
+        sel = np.concatenate([above, ties])
+    else:
+        sel = np.arange(mag.size)
+    order = sel[np.argsort(-mag[sel], kind="stable")]
+    return [
+        Correlation.model_construct(
+            left=names[iu[idx]], right=names[ju[idx]], pearson=float(vals[idx])
+        )
+        for idx in order
+    ]
+
+
+def _polars_value_counts(series) -> tuple[pd.Series, int]:
+    """
+    Polars counterpart of `_value_counts`, with the same keys, counts and tie order.
+
+    Only the distinct values cross into Python: the group-by keeps first-seen order,
+    so the final sort matches `_value_counts` exactly.
+    """
+
+    values = series.drop_nulls()
+    name = values.name
+    vc = values.to_frame().group_by(name, maintain_order=True).len()
+    counts = pd.Series(
+        vc.get_column("len").to_numpy(),
+        index=[str(value) for value in vc.get_column(name).to_list()],
+    )
+    if not counts.index.is_unique:
+        counts = counts.groupby(level=0, sort=False).sum()
+    return counts.sort_values(ascending=False), int(values.len())
+
+
+def _scan_csv_polars(pl, path: str):
+    """
+    Lazily scan a CSV with pandas' missing-value tokens.
+
+    Why: column types are inferred from every row, as `pd.read_csv` does; with
+    Polars' default of the first 100 rows, a later float or text cell in an integer
+    column fails the scan.
+    """
+
+    return pl.scan_csv(path, null_values=_PANDAS_NA_VALUES, infer_schema_length=None)
+
+
+def _profile_csv_polars(pl, path: str, cfg: ProfileConfig) -> DatasetProfile:
+    """
+    `profile_csv` on the Polars engine.
+
+    CSV parsing, missing counts and value counts run in Polars' threaded engine;
+    numeric summaries and correlations reuse the numpy kernels. The sampled rows, the
+    missing-value tokens and the tie order of value counts are the pandas engine's, so
+    both engines report the same statistics. Differences: column dtypes are reported
+    with Polars names, and a column the two parsers type differently (e.g. text that
+    only Polars reads as a date) is summarized by its own engine's type.
+    """
+
+    df = _scan_csv_polars(pl, path).collect()
+    if cfg.sample_rows is not None and df.height > cfg.sample_rows:
+        # The positions `DataFrame.sample(n, random_state=0)` draws, in its order.
+        df = df[np.random.RandomState(0).choice(df.height, size=cfg.sample_rows, replace=False)]
+
+    rows = df.height
+    schema = df.schema
+    missing_counts = df.null_count().row(0)
+    numeric_cols = [name for name, dtype in schema.items() if dtype.is_numeric()]
+    numeric = (
+        df.select(pl.col(numeric_cols).cast(pl.Float64)).to_numpy()
+        if numeric_cols
+        else np.empty((rows, 0), dtype=np.float64)
+    )
+
+    summaries = iter(
+        _numeric_summaries(
+            numeric,
+            missing=[m for m, d in zip(missing_counts, schema.values()) if d.is_numeric()],
+            quantiles=cfg.quantiles,
+        )
+    )
+
+    profiles: list[ColumnProfile] = []
+    for (name, dtype), missing in zip(schema.items(), missing_counts):
+        if dtype.is_numeric():
+            summary = next(summaries)
+            profiles.append(
+                ColumnProfile.model_construct(
+                    name=name, dtype=str(dtype), kind="numeric", numeric=summary
+                )
+            )
+            continue
+
+        if dtype in (pl.String, pl.Categorical, pl.Boolean):
+            counts, total = _polars_value_counts(df.get_column(name))
+            unique = int(counts.shape[0])
+            if unique <= cfg.max_unique_categorical:
+                categorical = CategoricalSummary.model_construct(
+                    count=rows,
+                    missing=int(missing),
+                    unique=unique,
+                    top=_top_values(counts, total, top_k=cfg.top_k),
+                )
+                profiles.append(
+                    ColumnProfile.model_construct(
+                        name=name, dtype=str(dtype), kind="categorical", categorical=categorical
+                    )
+                )
+                continue
+
+        profiles.append(ColumnProfile.model_construct(name=name, dtype=str(dtype), kind="other"))
+
+    return DatasetProfile.model_construct(
+        path=str(path),
+        rows=rows,
+        columns=df.width,
+        profiles=profiles,
+        correlations=_top_correlations(numeric, numeric_cols, cfg.top_correlations),
+    )
+
+
 def profile_csv(path: str, config: ProfileConfig) -> DatasetProfile:
     """
     Profile a CSV file and return a JSON-serializable dataset summary.
@@ -173,103 +884,323 @@ def profile_csv(path: str, config: ProfileConfig) -> DatasetProfile:
     and serializes it to a JSON-friendly dict for transport to TypeScript.
     """
 
-    cfg = ProfileConfig.model_validate(config)
-
-    df = pd.read_csv(path)
-    if cfg.sample_rows is not None and len(df) > cfg.sample_rows:
-        df = df.sample(n=cfg.sample_rows, random_state=0)
+    # Typed configs were validated when they were built; only raw dicts need it here.
+    cfg = config if isinstance(config, ProfileConfig) else ProfileConfig.model_validate(config)
+    if cfg.engine == "polars":
+        pl = _import_polars()
+        if pl is not None:
+            return _profile_csv_polars(pl, path, cfg)
+
+    if cfg.sample_rows is None:
+        df = _load_csv(path)
+    else:
+        df = _read_csv_sample(path, cfg.sample_rows)
+    dtypes = df.dtypes
+
+    # Classify every column once from its dtype, then run each kind as a batch:
+    # one isna() pass for all missing counts and one float64 matrix shared by the
+    # numeric summaries and the correlation step.
+    kinds = [_column_kind(dtype) for dtype in dtypes]
+    missing_counts = df.isna().sum().to_numpy()
+    numeric_cols = [col for col, kind in zip(df.columns, kinds) if kind == "numeric"]
+    numeric = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    rows = int(df.shape[0])
+
+    summaries = iter(
+        _numeric_summaries(
+            numeric,
+            missing=[m for m, kind in zip(missing_counts, kinds) if kind == "numeric"],
+            quantiles=cfg.quantiles,
+        )
+    )
 
     profiles: list[ColumnProfile] = []
-    for col in df.columns:
-        series = df[col]
-        missing = int(series.isna().sum())
-        dtype = str(series.dtype)
-
-        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
-            cleaned = pd.to_numeric(series, errors="coerce").dropna()
-            quantiles = (
-                cleaned.quantile(cfg.quantiles).to_dict() if len(cleaned) > 0 else {}
-            )
-            numeric = NumericSummary(
-                count=int(series.shape[0]),
-                missing=missing,
-                mean=float(cleaned.mean()) if len(cleaned) > 0 else None,
-                std=float(cleaned.std()) if len(cleaned) > 1 else None,
-                min=float(cleaned.min()) if len(cleaned) > 0 else None,
-                max=float(cleaned.max()) if len(cleaned) > 0 else None,
-                quantiles={str(k): float(v) for k, v in quantiles.items()},
-            )
+    for col, kind, dtype, missing in zip(df.columns, kinds, dtypes, missing_counts):
+        if kind == "numeric":
+            summary = next(summaries)
             profiles.append(
-                ColumnProfile(name=str(col), dtype=dtype, kind="numeric", numeric=numeric)
+                ColumnProfile.model_construct(
+                    name=str(col), dtype=str(dtype), kind="numeric", numeric=summary
+                )
             )
             continue
 
         # treat low-cardinality object columns as categorical
-        if pd.api.types.is_object_dtype(series) or pd.api.types.is_bool_dtype(series):
-            values = series.dropna().astype(str)
-            unique = int(values.nunique(dropna=True))
+        if kind == "categorical":
+            counts, total = _value_counts(df[col])
+            unique = int(counts.shape[0])
             if unique <= cfg.max_unique_categorical:
-                counts = values.value_counts().head(cfg.top_k)
-                total = float(values.shape[0]) if values.shape[0] > 0 else 1.0
-                top = [
-                    ValueCount(value=str(k), count=int(v), pct=float(v) / total)
-                    for k, v in counts.items()
-                ]
-                categorical = CategoricalSummary(
-                    count=int(series.shape[0]),
-                    missing=missing,
+                top = _top_values(counts, total, top_k=cfg.top_k)
+                categorical = CategoricalSummary.model_construct(
+                    count=rows,
+                    missing=int(missing),
                     unique=unique,
                     top=top,
                 )
                 profiles.append(
-                    ColumnProfile(
+                    ColumnProfile.model_construct(
                         name=str(col),
-                        dtype=dtype,
+                        dtype=str(dtype),
                         kind="categorical",
                         categorical=categorical,
                     )
                 )
                 continue
 
-        profiles.append(ColumnProfile(name=str(col), dtype=dtype, kind="other"))
-
-    correlations: list[Correlation] = []
-    if cfg.top_correlations > 0:
-        numeric_cols = [p.name for p in profiles if p.kind == "numeric"]
-        if len(numeric_cols) >= 2:
-            corr = df[numeric_cols].corr(numeric_only=True)
-            pairs: list[Correlation] = []
-            for i, left in enumerate(numeric_cols):
-                for right in numeric_cols[i + 1 :]:
-                    val = corr.loc[left, right]
-                    if pd.isna(val):
-                        continue
-                    pairs.append(
-                        Correlation(left=left, right=right, pearson=float(val))
-                    )
-            pairs.sort(key=lambda c: abs(c.pearson), reverse=True)
-            correlations = pairs[: cfg.top_correlations]
+        profiles.append(
+            ColumnProfile.model_construct(name=str(col), dtype=str(dtype), kind="other")
+        )
 
-    profile = DatasetProfile(
+    profile = DatasetProfile.model_construct(
         path=str(path),
         rows=int(df.shape[0]),
         columns=int(df.shape[1]),
         profiles=profiles,
-        correlations=correlations,
+        correlations=_top_correlations(
+            numeric, [str(col) for col in numeric_cols], cfg.top_correlations
+        ),
     )
     return profile
 
 
-def _value_counts_normalized(series: pd.Series, *, top_k: int) -> tuple[dict[str, float], list[ValueCount]]:
-    values = series.dropna().astype(str)
-    counts = values.value_counts()
-    total = float(values.shape[0]) if values.shape[0] > 0 else 1.0
-    normalized = {str(k): float(v) / total for k, v in counts.items()}
-    top = [
-        ValueCount(value=str(k), count=int(v), pct=float(v) / total)
+def _first_seen_counts(series: pd.Series) -> tuple[pd.Series, int]:
+    """Count non-missing values by their string form, in first-seen order."""
+
+    codes, uniques = pd.factorize(series)
+    codes = codes[codes >= 0]
+    counts = pd.Series(
+        np.bincount(codes, minlength=len(uniques)),
+        index=[str(value) for value in uniques],
+    )
+    if not counts.index.is_unique:
+        # Distinct raw values with the same string form (e.g. 1 and "1") count together.
+        counts = counts.groupby(level=0, sort=False).sum()
+    return counts, int(codes.size)
+
+
+def _value_counts(series: pd.Series) -> tuple[pd.Series, int]:
+    """
+    Count non-missing values by their string form, most frequent first.
+
+    Why: `series.dropna().astype(str).value_counts()` builds a Python string for every
+    row and hashes them all. Factorizing the raw values and counting the integer codes
+    with `np.bincount` stays in C; only the distinct values are stringified. Sorting
+    the counts in first-seen order reproduces `value_counts()`'s ordering of ties.
+    """
+
+    counts, total = _first_seen_counts(series)
+    return counts.sort_values(ascending=False), total
+
+
+def _top_values(counts: pd.Series, total: int, *, top_k: int) -> list[ValueCount]:
+    denom = float(total) if total > 0 else 1.0
+    return [
+        ValueCount.model_construct(value=str(k), count=int(v), pct=float(v) / denom)
         for k, v in counts.head(top_k).items()
     ]
-    return normalized, top
+
+
+def _numeric_drifts(
+    columns: list[str],
+    bmeans: list[float | None],
+    cmeans: list[float | None],
+    threshold: float,
+) -> list[NumericDrift]:
+    """Relative mean change per column, computed for all columns in one array pass."""
+
+    b = np.array(bmeans, dtype=np.float64)  # None -> NaN
+    c = np.array(cmeans, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rel = np.where(np.abs(b) > 1e-12, (c - b) / np.abs(b), np.nan)
+    drifted = np.abs(rel) >= threshold  # NaN (no relative change) compares False
+    return [
+        NumericDrift.model_construct(
+            column=column,
+            baseline_mean=bmean,
+            current_mean=cmean,
+            relative_change=None if np.isnan(r) else float(r),
+            drifted=bool(d),
+        )
+        for column, bmean, cmean, r, d in zip(columns, bmeans, cmeans, rel, drifted)
+    ]
+
+
+def _categorical_drift(
+    column: str,
+    bcounts: tuple[pd.Series, int],
+    ccounts: tuple[pd.Series, int],
+    *,
+    top_k: int,
+    threshold: float,
+) -> CategoricalDrift:
+    (bc, btotal), (cc, ctotal) = bcounts, ccounts
+    bdist = bc / (float(btotal) if btotal > 0 else 1.0)
+    cdist = cc / (float(ctotal) if ctotal > 0 else 1.0)
+    # Align both distributions on the union of categories (missing -> 0) and
+    # take the L1 distance in one vectorized pass.
+    keys = bdist.index.union(cdist.index)
+    b = bdist.reindex(keys, fill_value=0.0).to_numpy(dtype=np.float64)
+    c = cdist.reindex(keys, fill_value=0.0).to_numpy(dtype=np.float64)
+    l1 = float(np.abs(b - c).sum()) / 2.0
+    return CategoricalDrift.model_construct(
+        column=column,
+        l1_distance=l1,
+        baseline_top=_top_values(bc, btotal, top_k=top_k),
+        current_top=_top_values(cc, ctotal, top_k=top_k),
+        drifted=bool(l1 >= threshold),
+    )
+
+
+# Rows per chunk when streaming CSVs for drift detection.
+_DRIFT_CHUNK_ROWS = 1_000_000
+
+
+def _stream_stats(
+    path: str, columns: list[str], *, chunksize: int = _DRIFT_CHUNK_ROWS
+) -> tuple[dict[str, float | None], dict[str, tuple[pd.Series, int]]]:
+    """
+    Per-column means (numeric columns) and value counts (text columns) of a CSV,
+    accumulated chunk by chunk so memory stays bounded by `chunksize`.
+
+    A column is classified as a whole-file read would type it: numeric if every chunk
+    parses numeric, text if any chunk parses as text. All-missing chunks do not vote.
+    Columns that mix numeric and text chunks are recounted from their raw strings.
+    """
+
+    try:
+        return _stream_stats_of(path, columns, chunksize, arrow=True)
+    except _ArrowCsvMismatch:
+        return _stream_stats_of(path, columns, chunksize, arrow=False)
+
+
+def _stream_stats_of(
+    path: str, columns: list[str], chunksize: int, *, arrow: bool
+) -> tuple[dict[str, float | None], dict[str, tuple[pd.Series, int]]]:
+    """`_stream_stats` over the chunks of `_iter_csv_chunks(..., arrow=arrow)`."""
+
+    sums = {col: [0, 0.0] for col in columns}
+    counts: dict[str, dict[str, int]] = {col: {} for col in columns}
+    totals = dict.fromkeys(columns, 0)
+    kinds: dict[str, set[str]] = {col: set() for col in columns}
+
+    def add_counts(col: str, series: pd.Series) -> None:
+        # Merge into a dict so categories keep first-seen order across chunks; the
+        # final sort then breaks ties exactly like a single-pass `_value_counts`.
+        chunk_counts, total = _first_seen_counts(series)
+        acc = counts[col]
+        for value, n in chunk_counts.items():
+            acc[value] = acc.get(value, 0) + int(n)
+        totals[col] += total
+
+    for chunk in _iter_csv_chunks(path, columns, chunksize, arrow=arrow):
+        # One presence pass and one dtype lookup per chunk, not one per column.
+        present = chunk.notna().any().to_dict()
+        dtypes = chunk.dtypes.to_dict()
+        for col in columns:
+            if not present[col]:
+                continue
+            series = chunk[col]
+            if pd.api.types.is_numeric_dtype(dtypes[col]):
+                kinds[col].add("numeric")
+                arr = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                arr = arr[~np.isnan(arr)]
+                sums[col][0] += arr.size
+                sums[col][1] += float(arr.sum())
+            elif _is_text_like(series):
+                kinds[col].add("text")
+                add_counts(col, series)
+            else:
+                kinds[col].add("other")
+
+    mixed = [col for col in columns if kinds[col] == {"numeric", "text"}]
+    if mixed:
+        for col in mixed:
+            counts[col], totals[col] = {}, 0
+        for chunk in pd.read_csv(path, usecols=mixed, dtype=str, chunksize=chunksize):
+            for col in mixed:
+                add_counts(col, chunk[col])
+
+    means = {
+        col: (sums[col][1] / sums[col][0] if sums[col][0] > 0 else None)
+        for col in columns
+        if kinds[col] <= {"numeric"}
+    }
+    text = {
+        col: (
+            pd.Series(counts[col], dtype=np.intp).sort_values(ascending=False),
+            totals[col],
+        )
+        for col in columns
+        if "text" in kinds[col] and kinds[col] <= {"numeric", "text"}
+    }
+    return means, text
+
+
+def _drift_report_polars(
+    pl, baseline_path: str, current_path: str, cfg: DriftConfig
+) -> DriftReport:
+    """
+    `drift_report` on the Polars engine.
+
+    Only the shared columns are projected out of each scan. Means are summed in the
+    pandas engine's chunks and value counts keep its tie order, so both engines report
+    the same statistics for columns both parsers type alike.
+    """
+
+    bscan = _scan_csv_polars(pl, baseline_path)
+    cscan = _scan_csv_polars(pl, current_path)
+    bschema = bscan.collect_schema()
+    cschema = cscan.collect_schema()
+    shared = sorted(set(bschema.names()).intersection(cschema.names()))
+
+    def is_numeric(dtype) -> bool:
+        # pandas' is_numeric_dtype (the pandas engine's test) also accepts bools.
+        return dtype.is_numeric() or dtype == pl.Boolean
+
+    def is_text(dtype) -> bool:
+        return dtype in (pl.String, pl.Categorical)
+
+    numeric_cols = [c for c in shared if is_numeric(bschema[c]) and is_numeric(cschema[c])]
+    text_cols = [c for c in shared if is_text(bschema[c]) and is_text(cschema[c])]
+    wanted = numeric_cols + text_cols
+    baseline = bscan.select(wanted).collect()
+    current = cscan.select(wanted).collect()
+
+    def chunked_means(df) -> list[float | None]:
+        # Same summation order as `_stream_stats`: NaN-free sums per row chunk.
+        arr = df.select(pl.col(numeric_cols).cast(pl.Float64)).to_numpy()
+        out: list[float | None] = []
+        for col in arr.T:
+            n, total = 0, 0.0
+            for start in range(0, col.size, _DRIFT_CHUNK_ROWS):
+                chunk = col[start : start + _DRIFT_CHUNK_ROWS]
+                chunk = chunk[~np.isnan(chunk)]
+                n += chunk.size
+                total += float(chunk.sum())
+            out.append(total / n if n > 0 else None)
+        return out
+
+    numeric = _numeric_drifts(
+        numeric_cols, chunked_means(baseline), chunked_means(current), cfg.numeric_mean_threshold
+    )
+
+    categorical = [
+        _categorical_drift(
+            col,
+            _polars_value_counts(baseline.get_column(col)),
+            _polars_value_counts(current.get_column(col)),
+            top_k=cfg.top_k,
+            threshold=cfg.categorical_l1_threshold,
+        )
+        for col in text_cols
+    ]
+
+    return DriftReport.model_construct(
+        baseline_path=str(baseline_path),
+        current_path=str(current_path),
+        numeric=numeric,
+        categorical=categorical,
+    )
 
 
 def drift_report(
@@ -279,61 +1210,44 @@ def drift_report(
     Compare two CSVs and return a JSON-serializable drift report.
     """
 
-    cfg = DriftConfig.model_validate(config)
-    baseline = pd.read_csv(baseline_path)
-    current = pd.read_csv(current_path)
-
-    numeric: list[NumericDrift] = []
-    for col in sorted(set(baseline.columns).intersection(current.columns)):
-        if not (
-            pd.api.types.is_numeric_dtype(baseline[col])
-            and pd.api.types.is_numeric_dtype(current[col])
-        ):
-            continue
-        b = pd.to_numeric(baseline[col], errors="coerce").dropna()
-        c = pd.to_numeric(current[col], errors="coerce").dropna()
-        bmean = float(b.mean()) if len(b) > 0 else None
-        cmean = float(c.mean()) if len(c) > 0 else None
-        rel = None
-        if bmean is not None and cmean is not None and abs(bmean) > 1e-12:
-            rel = (cmean - bmean) / abs(bmean)
-        drifted = bool(rel is not None and abs(rel) >= cfg.numeric_mean_threshold)
-        numeric.append(
-            NumericDrift(
-                column=str(col),
-                baseline_mean=bmean,
-                current_mean=cmean,
-                relative_change=rel,
-                drifted=drifted,
-            )
+    cfg = config if isinstance(config, DriftConfig) else DriftConfig.model_validate(config)
+    if cfg.engine == "polars":
+        pl = _import_polars()
+        if pl is not None:
+            return _drift_report_polars(pl, baseline_path, current_path, cfg)
+
+    # Stream both files (only the shared columns) instead of materializing them;
+    # the headers are read first to find those columns.
+    shared = sorted(
+        set(pd.read_csv(baseline_path, nrows=0).columns).intersection(
+            pd.read_csv(current_path, nrows=0).columns
         )
-
-    categorical: list[CategoricalDrift] = []
-    for col in sorted(set(baseline.columns).intersection(current.columns)):
-        if not (
-            pd.api.types.is_object_dtype(baseline[col])
-            and pd.api.types.is_object_dtype(current[col])
-        ):
-            continue
-        bdist, btop = _value_counts_normalized(baseline[col], top_k=cfg.top_k)
-        cdist, ctop = _value_counts_normalized(current[col], top_k=cfg.top_k)
-        keys = set(bdist.keys()).union(cdist.keys())
-        l1 = 0.0
-        for k in keys:
-            l1 += abs(bdist.get(k, 0.0) - cdist.get(k, 0.0))
-        l1 = l1 / 2.0
-        drifted = l1 >= cfg.categorical_l1_threshold
-        categorical.append(
-            CategoricalDrift(
-                column=str(col),
-                l1_distance=float(l1),
-                baseline_top=btop,
-                current_top=ctop,
-                drifted=bool(drifted),
-            )
+    )
+    bmeans, bcounts = _stream_stats(baseline_path, shared)
+    cmeans, ccounts = _stream_stats(current_path, shared)
+
+    # Columns were classified once per file while streaming; keep those both agree on.
+    numeric_cols = [col for col in shared if col in bmeans and col in cmeans]
+    text_cols = [col for col in shared if col in bcounts and col in ccounts]
+
+    numeric = _numeric_drifts(
+        [str(col) for col in numeric_cols],
+        [bmeans[col] for col in numeric_cols],
+        [cmeans[col] for col in numeric_cols],
+        cfg.numeric_mean_threshold,
+    )
+    categorical = [
+        _categorical_drift(
+            str(col),
+            bcounts[col],
+            ccounts[col],
+            top_k=cfg.top_k,
+            threshold=cfg.categorical_l1_threshold,
         )
+        for col in text_cols
+    ]
 
-    report = DriftReport(
+    report = DriftReport.model_construct(
         baseline_path=str(baseline_path),
         current_path=str(current_path),
         numeric=numeric,
@@ -352,7 +1266,6 @@ def top_users_by_spend(path: str, top_n: int = 10) -> pd.DataFrame:
     often swap in their own CSVs. Being defensive here avoids a confusing KeyError.
     """
 
-    df = pd.read_csv(path)
     cols = [
         "user_id",
         "country",
@@ -361,14 +1274,24 @@ def top_users_by_spend(path: str, top_n: int = 10) -> pd.DataFrame:
         "spend_usd_last_7d",
         "churned",
     ]
-    cols = [c for c in cols if c in df.columns]
-    if "spend_usd_last_7d" not in df.columns:
-        return df[cols].head(top_n)
-    # The JSON codec requires a default RangeIndex; sort_values().head() keeps
-    # the original row labels, so drop them.
-    return (
-        df[cols]
-        .sort_values("spend_usd_last_7d", ascending=False)
-        .head(top_n)
-        .reset_index(drop=True)
-    )
+    header = pd.read_csv(path, nrows=0).columns
+    cols = [c for c in cols if c in header]
+    if not cols:
+        # No column to report: a frame with only the first rows' labels, as
+        # `df[[]].head(top_n)` gives, without parsing (or caching) the whole file.
+        return pd.read_csv(path, nrows=top_n)[cols]
+    # Only the reported columns are parsed.
+    projected = _load_csv(path, columns=cols)
+    if "spend_usd_last_7d" not in cols:
+        return projected.head(top_n)
+    # nlargest is a partial selection (O(n log k)) rather than a full sort. It skips
+    # missing spend values and rejects non-numeric columns, so those cases keep the
+    # sort, which places NaN last.
+    top = None
+    if pd.api.types.is_numeric_dtype(projected["spend_usd_last_7d"]):
+        top = projected.nlargest(top_n, "spend_usd_last_7d")
+    if top is None or len(top) < min(top_n, len(projected)):
+        top = projected.sort_values("spend_usd_last_7d", ascending=False).head(top_n)
+    # The JSON codec requires a default RangeIndex; both paths keep the original
+    # row labels, so drop them.
+    return top.reset_index(drop=True)
@@ -38,8 +38,10 @@ backward compatibility, since this package ships runtime/ and external importers
 may reference e.g. serialize() or dispatch_request().
 """
 import sys
+import io
 import json
 import os
+import re
 import importlib  # noqa: F401  (re-exported for compat / used by handlers via core)
 
 import tywrap_bridge_core as core
@@ -94,8 +96,22 @@ except (OSError, ValueError, TypeError, AttributeError) as exc:
     except (OSError, ValueError):
         pass
 
+def _parse_bool_env(name, default=False):
+    """
+    Return whether env var `name` is set to 1/true/yes (case-insensitive).
+
+    An unset or empty variable yields `default`.
+    """
+    raw = os.environ.get(name, '')
+    if not raw:
+        return default
+    return raw.lower() in ('1', 'true', 'yes')
+
+
+# Why: env flags are read once at startup; the serializers receive the parsed
+# values as parameters instead of consulting os.environ per value.
 FALLBACK_JSON = os.environ.get('TYWRAP_CODEC_FALLBACK', '').lower() == 'json'
-TORCH_ALLOW_COPY = os.environ.get('TYWRAP_TORCH_ALLOW_COPY', '').lower() in ('1', 'true', 'yes')
+TORCH_ALLOW_COPY = _parse_bool_env('TYWRAP_TORCH_ALLOW_COPY')
 BRIDGE_NAME = 'python-subprocess'
 
 
@@ -123,7 +139,12 @@ def parse_allowed_modules():
 ALLOWED_MODULES = parse_allowed_modules()
 # Why: underscore-prefixed (private/dunder) attribute access is blocked by default
 # to prevent sandbox-escape via __globals__/__subclasses__/__builtins__; this opts out.
-ALLOW_PRIVATE_ATTRS = os.environ.get('TYWRAP_ALLOW_PRIVATE_ATTRS', '').lower() in ('1', 'true', 'yes')
+ALLOW_PRIVATE_ATTRS = _parse_bool_env('TYWRAP_ALLOW_PRIVATE_ATTRS')
+
+# Why: handler errors carry a formatted traceback by default; formatting walks the
+# stack and reads source lines, which dominates tight error loops. Opt out with
+# TYWRAP_SEND_TRACEBACK=0 to send only the error type and message.
+SEND_TRACEBACK = _parse_bool_env('TYWRAP_SEND_TRACEBACK', default=True)
 
 
 class CodecConfigError(ValueError):
@@ -197,6 +218,97 @@ _response_codec = BridgeCodec(
     max_payload_bytes=sys.maxsize,
 )
 
+try:
+    import orjson as _orjson
+except ImportError:  # Optional accelerator; the stdlib codec above is the reference.
+    _orjson = None
+
+# Scalars that orjson and json.dumps write identically. Floats only qualify inside
+# [1e-4, 1e16) (or zero), where both write the shortest repr without an exponent.
+_PLAIN_SCALAR_TYPES = frozenset((int, bool, type(None)))
+
+
+def _is_plain_json(value):
+    """
+    Return whether orjson encodes value byte-for-byte like BridgeCodec.
+
+    That holds for exact dicts with ASCII str keys, lists and tuples, ASCII strs,
+    ints, bools, None and floats in the range above. Anything else (enums and other
+    subclasses, values needing the default encoder, non-ASCII text that BridgeCodec
+    escapes, NaN/Infinity, floats in exponent notation) is not plain.
+    """
+    stack = [value]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        item = pop()
+        item_type = type(item)
+        if item_type is float:
+            if not (1e-4 <= abs(item) < 1e16 or item == 0.0):
+                return False
+        elif item_type is str:
+            if not item.isascii():
+                return False
+        elif item_type is list or item_type is tuple:
+            # Lists of ints need no per-item visit; the type scan runs in C.
+            if not _PLAIN_SCALAR_TYPES.issuperset(map(type, item)):
+                extend(item)
+        elif item_type is dict:
+            for key in item:
+                if type(key) is not str or not key.isascii():
+                    return False
+            extend(item.values())
+        elif item_type not in _PLAIN_SCALAR_TYPES:
+            return False
+    return True
+
+
+def _fast_encode(out):
+    """
+    Encode a response with orjson when installed, or return None to use BridgeCodec.
+
+    Why: orjson encodes large results (e.g. JSON-fallback float ndarrays) several
+    times faster than json.dumps and yields UTF-8 bytes directly. It is only used
+    for responses _is_plain_json proves it encodes identically, so the bytes (and
+    the TYWRAP_CODEC_MAX_BYTES check) never depend on whether orjson is installed.
+    Ints beyond 64 bits make orjson raise, which also falls back.
+    """
+    if _orjson is None or not _is_plain_json(out):
+        return None
+    try:
+        return _orjson.dumps(out)
+    except Exception:  # noqa: BLE001
+        return None
+
+
+# Maps ASCII digits to b'0' and every other byte to b'.', so a run of 19+ digits
+# becomes a plain substring search (a regex like \d{19} is ~10x slower).
+_DIGIT_MASK = bytes(0x30 if 0x30 <= b <= 0x39 else 0x2E for b in range(256))
+_LONG_DIGIT_RUN = b'0' * 19
+
+
+def _loads(data):
+    """
+    Parse a JSON request (str, or UTF-8 bytes) with orjson when installed.
+
+    Why: request parsing runs on every call and orjson reads bytes straight from the
+    binary stdin buffer. json.loads stays the reference parser: any input orjson
+    rejects (NaN/Infinity literals, lone surrogates, or invalid JSON) is re-parsed
+    with json.loads, so accepted requests and JSONDecodeError messages are
+    unchanged. Some orjson versions read integers beyond 64 bits as floats, so
+    any line with a 19+ digit run (possibly inside a string) also skips orjson.
+    """
+    if (
+        _orjson is not None
+        and isinstance(data, bytes)
+        and _LONG_DIGIT_RUN not in data.translate(_DIGIT_MASK)
+    ):
+        try:
+            return _orjson.loads(data)
+        except Exception:  # noqa: BLE001
+            pass
+    return json.loads(data)
+
 
 def get_request_max_bytes():
     """
@@ -315,31 +427,44 @@ def dispatch_request(msg, *, has_envelope_markers=True):
 
 def encode_response(out):
     """
-    Serialize the response and enforce size limits.
+    Serialize the response to UTF-8 bytes and enforce size limits.
 
     Why: keep payload size checks outside the main loop for clarity and lint compliance.
-    Uses BridgeCodec to reject NaN/Infinity and handle edge cases like numpy scalars.
+    Uses BridgeCodec to reject NaN/Infinity and handle edge cases like numpy scalars,
+    after the optional orjson fast path (see _fast_encode).
     """
-    try:
-        payload = _response_codec.encode(out)
-    except CodecError as exc:
-        # Convert CodecError to ValueError for consistent error handling
-        raise ValueError(str(exc)) from exc
-    payload_utf8 = payload.encode('utf-8')
+    payload_utf8 = _fast_encode(out)
+    if payload_utf8 is None:
+        try:
+            payload_utf8 = _response_codec.encode(out).encode('utf-8')
+        except CodecError as exc:
+            # Convert CodecError to ValueError for consistent error handling
+            raise ValueError(str(exc)) from exc
     payload_bytes = len(payload_utf8)
     if CODEC_MAX_BYTES is not None and payload_bytes > CODEC_MAX_BYTES:
         raise PayloadTooLargeError(payload_bytes, CODEC_MAX_BYTES)
-    return payload, payload_utf8
+    return payload_utf8
 
 
-def write_payload(payload: str) -> bool:
+def write_payload(payload) -> bool:
     """
-    Write a JSONL payload to stdout and flush.
+    Write a JSONL payload (str, or UTF-8 bytes) to stdout and flush.
 
     Why: centralize BrokenPipe handling so the main loop can exit cleanly when the
-    parent process goes away.
+    parent process goes away. Encoded responses are written as bytes straight to the
+    binary buffer, skipping a second UTF-8 encode in the text layer; every write
+    flushes, so text and binary writes never interleave out of order. The newline
+    is a separate write so a large payload is never copied just to append it.
     """
     try:
+        if isinstance(payload, bytes):
+            buffer = getattr(sys.stdout, 'buffer', None)
+            if buffer is not None:
+                buffer.write(payload)
+                buffer.write(b'\n')
+                buffer.flush()
+                return True
+            payload = payload.decode('utf-8')
         sys.stdout.write(payload + '\n')
         sys.stdout.flush()
         return True
@@ -347,7 +472,21 @@ def write_payload(payload: str) -> bool:
         return False
 
 
-def write_response(payload: str, payload_utf8: bytes, response_id) -> bool:
+def _encode_frame(frame):
+    """
+    Encode one ``tywrap-frame/1`` envelope to UTF-8 bytes.
+
+    Why: frames only exist for oversize responses, so json.dumps would re-escape
+    the whole payload a second time. Frames hold only ints and ASCII strs (slices
+    of an encoded response, which is always ASCII), so they are plain JSON that
+    orjson writes exactly as json.dumps does.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(frame)
+    return _response_codec.encode(frame).encode('utf-8')
+
+
+def write_response(payload_utf8: bytes, response_id) -> bool:
     """
     Write a fully-encoded JSONL response, fragmenting it into ``tywrap-frame/1``
     frames when the payload exceeds the fixed per-frame ceiling.
@@ -368,16 +507,16 @@ def write_response(payload: str, payload_utf8: bytes, response_id) -> bool:
     """
     payload_bytes = len(payload_utf8)
     if payload_bytes <= MAX_FRAME_BYTES:
-        return write_payload(payload)
+        return write_payload(payload_utf8)
 
     if not isinstance(response_id, int) or isinstance(response_id, bool):
         # Cannot correlate frames without an integer id; emit as one line. This
         # only happens for tiny malformed-request error envelopes (id=None),
         # which never exceed a sane frame ceiling.
-        return write_payload(payload)
+        return write_payload(payload_utf8)
 
     frames = encode_frames(
-        payload,
+        payload_utf8.decode('utf-8'),
         id=response_id,
         stream='response',
         max_frame_bytes=MAX_FRAME_BYTES,
@@ -386,7 +525,7 @@ def write_response(payload: str, payload_utf8: bytes, response_id) -> bool:
     for frame in frames:
         # One frame per JSONL line; flush per frame so the pipe backpressures
         # and the TS reader can interleave reassembly with the write.
-        if not write_payload(_response_codec.encode(frame)):
+        if not write_payload(_encode_frame(frame)):
             return False
     return True
 
@@ -412,34 +551,61 @@ def _accept_request_frame(frame):
     return _request_reassembler.accept(frame)
 
 
-def _try_parse_frame_line(line):
+# Marks a stdin line that main() could not parse; process_request_line() parses it
+# again itself so the JSON error is reported through the normal response path.
+_UNPARSED = object()
+
+
+def _parse_stdin_line(line):
     """
-    Return a frame dict if ``line`` is a ``tywrap-frame/1`` envelope, else None.
+    Parse one stdin line, returning ``_UNPARSED`` when it is not valid JSON.
 
-    Why: a request frame is a JSON object carrying ``__tywrap_frame__``. We only
-    treat a line as a frame when it parses as such an
-    object; anything else (including invalid JSON) falls through to the normal
+    Why: every line is parsed exactly once. A request frame is a JSON object
+    carrying ``__tywrap_frame__`` and goes to the Reassembler; anything else
+    (including invalid JSON) is handed, with its parsed value, to the normal
     single-line request path, which reports the JSON error exactly as before.
     Structural validity (protocol, seq/total ranges, etc.) is enforced by the
     Reassembler, not here.
     """
     try:
-        parsed = json.loads(line)
-    except json.JSONDecodeError:
+        return _loads(line)
+    except ValueError:
+        return _UNPARSED
+
+
+# '__tywrap' or '__type__' in one scan; two substring searches cost ~3x as much.
+_ENVELOPE_MARKER = re.compile(r'__ty(?:wrap|pe__)')
+_ENVELOPE_MARKER_BYTES = re.compile(rb'__ty(?:wrap|pe__)')
+
+
+def _request_id_of_undecodable(line):
+    """
+    Best-effort request id of a stdin line that is not valid UTF-8.
+
+    Why: the error response for such a line should still correlate with its
+    request, so the line is parsed once more with the bad bytes replaced.
+    """
+    try:
+        msg = json.loads(line.decode('utf-8', 'replace'))
+    except ValueError:
         return None
-    if isinstance(parsed, dict) and '__tywrap_frame__' in parsed:
-        return parsed
-    return None
+    req_id = msg.get('id') if isinstance(msg, dict) else None
+    return req_id if isinstance(req_id, int) else None
+
 
+def _is_frame(parsed):
+    return isinstance(parsed, dict) and '__tywrap_frame__' in parsed
 
-def process_request_line(line):
+
+def process_request_line(line, msg=_UNPARSED):
     """
     Process one complete logical request line and write its response.
 
-    ``line`` is the full logical JSON request: either a single line read from
-    stdin, or the payload reassembled from ``tywrap-frame/1`` request frames.
-    TYWRAP_REQUEST_MAX_BYTES is enforced on this complete payload (so for a
-    chunked request the limit applies to the REASSEMBLED size, not per frame).
+    ``line`` is the full logical JSON request as UTF-8 bytes (str is also
+    accepted): either a single line read from stdin, or the payload reassembled
+    from ``tywrap-frame/1`` request frames. ``msg`` is the already-parsed request
+    when the caller has one. TYWRAP_REQUEST_MAX_BYTES is enforced on this complete payload (so for
+    a chunked request the limit applies to the REASSEMBLED size, not per frame).
 
     Returns True to keep the loop running, or False if the parent's stdin / our
     stdout closed mid-write (BrokenPipe), so main() can exit cleanly.
@@ -448,17 +614,27 @@ def process_request_line(line):
     out = None
     try:
         if REQUEST_MAX_BYTES is not None:
-            payload_bytes = len(line.encode('utf-8'))
+            payload_bytes = len(line) if isinstance(line, bytes) else len(line.encode('utf-8'))
             if payload_bytes > REQUEST_MAX_BYTES:
                 raise RequestTooLargeError(payload_bytes, REQUEST_MAX_BYTES)
-        msg = json.loads(line)
+        if msg is _UNPARSED:
+            if isinstance(line, bytes):
+                # Only lines that failed to parse get here, so valid requests never
+                # pay for this decode.
+                try:
+                    line.decode('utf-8')
+                except UnicodeDecodeError:
+                    mid = _request_id_of_undecodable(line)
+                    raise
+            msg = _loads(line)
         if isinstance(msg, dict):
             req_id = msg.get('id')
             if isinstance(req_id, int):
                 # Why: preserve request ids even when handlers raise.
                 mid = req_id
         try:
-            has_envelope_markers = '__tywrap' in line or '__type__' in line
+            marker = _ENVELOPE_MARKER_BYTES if isinstance(line, bytes) else _ENVELOPE_MARKER
+            has_envelope_markers = marker.search(line) is not None
             mid, result = dispatch_request(msg, has_envelope_markers=has_envelope_markers)
             out = {'id': mid, 'protocol': PROTOCOL, 'result': result}
         except ProtocolError as e:
@@ -466,7 +642,7 @@ def process_request_line(line):
             out = build_error_payload(mid, e, include_traceback=False)
         except Exception as e:  # noqa: BLE001
             # Why: ensure any handler error becomes a protocol-compliant response.
-            out = build_error_payload(mid, e, include_traceback=True)
+            out = build_error_payload(mid, e, include_traceback=SEND_TRACEBACK)
     except RequestTooLargeError as e:
         emit_protocol_diagnostic(str(e))
         out = build_error_payload(mid, e, include_traceback=False)
@@ -478,11 +654,11 @@ def process_request_line(line):
         out = build_error_payload(mid, e, include_traceback=False)
 
     try:
-        payload, payload_utf8 = encode_response(out)
+        payload_utf8 = encode_response(out)
         # Correlate frames by the response id when chunking; out always
         # carries the request id (or None for a malformed-request envelope).
         response_id = out.get('id') if isinstance(out, dict) else None
-        if not write_response(payload, payload_utf8, response_id):
+        if not write_response(payload_utf8, response_id):
             return False
     except Exception as e:  # noqa: BLE001
         # Why: fallback error keeps responses well-formed even if serialization fails.
@@ -490,15 +666,37 @@ def process_request_line(line):
         try:
             # Error envelopes are tiny; write as a single line regardless of
             # chunking so a serialization failure never recurses into framing.
-            if not write_payload(json.dumps(err_out)):
+            if not write_payload(json.dumps(err_out, separators=(',', ':')).encode('utf-8')):
                 return False
         except Exception:
             return False
     return True
 
 
+_STDIN_BUFFER_BYTES = 64 * 1024
+
+
+def open_request_stream():
+    """
+    Return a binary reader over stdin with a 64 KiB buffer.
+
+    Why: readline() refills in buffer-sized reads, so the default 8 KiB buffer
+    turns a multi-megabyte request into hundreds of read syscalls; 64 KiB matches
+    the Linux pipe capacity. Falls back to sys.stdin's own buffer when stdin has
+    no usable file descriptor (e.g. replaced in-process).
+    """
+    try:
+        fd = sys.stdin.fileno()
+    except (AttributeError, OSError, ValueError):
+        return getattr(sys.stdin, 'buffer', sys.stdin)
+    return io.open(fd, 'rb', buffering=_STDIN_BUFFER_BYTES, closefd=False)
+
+
 def main():
-    for line in sys.stdin:
+    # Read raw UTF-8 bytes: orjson parses them directly and the request size guard
+    # measures them without a re-encode.
+    stdin = open_request_stream()
+    for line in stdin:
         line = line.strip()
         if not line:
             continue
@@ -507,8 +705,9 @@ def main():
         # the completed logical request is handed to process_request_line (which
         # then enforces the request-size guard on the reassembled payload).
         # Non-frame lines are normal requests.
-        frame = _try_parse_frame_line(line)
-        if frame is not None:
+        parsed = _parse_stdin_line(line)
+        if _is_frame(parsed):
+            frame = parsed
             # JS serializes request frame bursts. A seq=0 frame for a different
             # id proves any older partial stream was abandoned; a duplicate
             # seq=0 for the same id must still fail loud in the reassembler.
@@ -525,14 +724,14 @@ def main():
             if reassembled is None:
                 # More frames needed for this id; await the rest.
                 continue
-            if not process_request_line(reassembled):
+            if not process_request_line(reassembled.encode('utf-8')):
                 return
             continue
 
         # Same idle-retention tradeoff as _accept_request_frame: a partial burst
         # is retained only until the next request or process restart.
         _request_reassembler.clear_pending()
-        if not process_request_line(line):
+        if not process_request_line(line, parsed):
             return
 
 
@@ -41,6 +41,7 @@ derived from TYWRAP_CODEC_FALLBACK=json so that "Node in json-fallback mode" and
 """
 
 import base64
+import binascii
 import datetime as dt
 import decimal
 import importlib
@@ -52,6 +53,7 @@ import sys
 import traceback
 import uuid
 from pathlib import Path, PurePath
+from types import MappingProxyType
 
 # Protocol constants. These MUST match src/runtime/protocol.ts (PROTOCOL_ID,
 # TYWRAP_PROTOCOL_VERSION) and the codec version baked into marker envelopes.
@@ -167,9 +169,15 @@ def import_allowed_module(module_name, allowed_modules):
     Import module_name only if permitted by the allowlist, else raise loudly.
 
     This is the single chokepoint every handler routes module imports through.
+    Already-imported modules are returned straight from sys.modules (the import
+    system's own cache), skipping import_module's bootstrap/lock bookkeeping on
+    every request; requests are handled serially, never mid-import.
     """
     if not _is_module_allowed(module_name, allowed_modules):
         raise ImportNotAllowedError(module_name)
+    mod = sys.modules.get(module_name)
+    if mod is not None:
+        return mod
     return importlib.import_module(module_name)
 
 
@@ -218,6 +226,23 @@ _ERR_BYTES_MISSING_DATA = 'Invalid bytes envelope: missing data'
 _ERR_BYTES_INVALID_BASE64 = 'Invalid bytes envelope: invalid base64'
 
 
+# binascii.a2b_base64(strict_mode=...) was added in Python 3.11.
+_A2B_STRICT = sys.version_info >= (3, 11)
+
+
+def _b64decode_strict(data):
+    """
+    Decode canonical base64, raising on anything outside the alphabet or padding.
+
+    Why: on Python 3.11+ binascii's strict mode performs the same validation as
+    b64decode(validate=True) inside the C decoder, skipping its extra regex scan
+    over the whole payload.
+    """
+    if _A2B_STRICT:
+        return binascii.a2b_base64(data, strict_mode=True)
+    return base64.b64decode(data, validate=True)
+
+
 def _deserialize_bytes_envelope(value):
     """
     Decode base64-encoded bytes envelopes from JS into Python bytes.
@@ -237,7 +262,7 @@ def _deserialize_bytes_envelope(value):
         if not isinstance(b64, str):
             raise ProtocolError(_ERR_BYTES_MISSING_B64)
         try:
-            return base64.b64decode(b64, validate=True)
+            return _b64decode_strict(b64)
         except Exception as exc:
             raise ProtocolError(_ERR_BYTES_INVALID_BASE64) from exc
 
@@ -246,7 +271,7 @@ def _deserialize_bytes_envelope(value):
         if not isinstance(data, str):
             raise ProtocolError(_ERR_BYTES_MISSING_DATA)
         try:
-            return base64.b64decode(data, validate=True)
+            return _b64decode_strict(data)
         except Exception as exc:
             raise ProtocolError(_ERR_BYTES_INVALID_BASE64) from exc
 
@@ -255,22 +280,36 @@ def _deserialize_bytes_envelope(value):
 
 def deserialize(value, *, has_envelope_markers=True):
     """
-    Recursively deserialize request values into Python-native types.
+    Deserialize request values into Python-native types.
 
     Why: requests are JSON-only; we need a small set of explicit decoders
     (currently bytes) to restore Python semantics at the boundary.
+
+    The request tree is owned by the bridge (fresh json.loads output), so nested
+    envelopes are replaced in place while walking an explicit stack: no container
+    copies, and no recursion limit on deeply nested arguments.
     """
-    if not has_envelope_markers:
+    # Scalars (the common argument shape) and marker-free requests need no walk.
+    if not has_envelope_markers or not isinstance(value, (list, dict)):
         return value
     decoded = _deserialize_bytes_envelope(value)
     if decoded is not _NO_DESERIALIZE:
         return decoded
 
-    if isinstance(value, list):
-        return [deserialize(item, has_envelope_markers=True) for item in value]
-    if isinstance(value, dict):
-        # Preserve dict shape while decoding nested values.
-        return {k: deserialize(v, has_envelope_markers=True) for k, v in value.items()}
+    stack = [value]
+    while stack:
+        container = stack.pop()
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, item in items:
+            if isinstance(item, dict):
+                decoded = _deserialize_bytes_envelope(item)
+                if decoded is _NO_DESERIALIZE:
+                    stack.append(item)
+                else:
+                    # Rebinding an existing key does not disturb the iteration.
+                    container[key] = decoded
+            elif isinstance(item, list):
+                stack.append(item)
     return value
 
 
@@ -287,16 +326,29 @@ def arrow_available():
     return True
 
 
+# Modules module_available() has already found. Only positive results are cached:
+# a package installed (or loaded by Pyodide) after a negative probe must still be
+# reported once it appears.
+_available_modules = set()
+
+
 def module_available(module_name):
     """
     Lightweight feature detection for optional codec dependencies via find_spec.
 
     Why: exposes availability in bridge metadata without importing heavy modules.
+    A found module stays found for the process lifetime, so repeat probes skip the
+    sys.path walk.
     """
+    if module_name in _available_modules:
+        return True
     try:
-        return importlib.util.find_spec(module_name) is not None
+        available = importlib.util.find_spec(module_name) is not None
     except (ImportError, AttributeError, TypeError, ValueError):
         return False
+    if available:
+        _available_modules.add(module_name)
+    return available
 
 
 def is_numpy_array(obj):
@@ -362,6 +414,69 @@ def is_sklearn_estimator(obj):
 # mode). The JSON fallback envelopes are byte-identical across both callers, which
 # is what the conformance suite asserts.
 
+_ipc_write_options = None
+
+
+def _get_ipc_write_options(pa):
+    """
+    Return the lazily-created IpcWriteOptions shared by every Arrow stream writer.
+
+    Why: new_stream() without options rebuilds them per call, re-reading pyarrow's
+    legacy-format environment variables each time; that is a large share of the
+    cost of encoding a small array. The defaults (current format, metadata V5) are
+    what the JS decoder expects.
+    """
+    global _ipc_write_options
+    if _ipc_write_options is None:
+        _ipc_write_options = pa.ipc.IpcWriteOptions()
+    return _ipc_write_options
+
+
+def _single_column_ipc_stream(pa, arr):
+    """
+    Write ``arr`` as a one-column ('value') Arrow IPC stream and return the buffer.
+
+    Why: a contiguous Array is written as a single RecordBatch directly, skipping
+    the Table wrapper and its re-batching; the stream bytes are identical. Chunked
+    input (e.g. pyarrow-backed pandas dtypes) still goes through a Table.
+    """
+    sink = pa.BufferOutputStream()
+    options = _get_ipc_write_options(pa)
+    if isinstance(arr, pa.ChunkedArray):
+        table = pa.Table.from_arrays([arr], names=['value'])
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+    else:
+        batch = pa.RecordBatch.from_arrays([arr], names=['value'])
+        with pa.ipc.new_stream(sink, batch.schema, options=options) as writer:
+            if batch.num_rows:
+                # write_table emits no batch for an empty table; match it.
+                writer.write_batch(batch)
+    return sink.getvalue()
+
+
+_b64encode = None
+
+
+def _b64encode_ascii(data):
+    """
+    Base64-encode a bytes-like object (e.g. a pyarrow Buffer) to an ASCII str.
+
+    Why: Arrow payloads can be hundreds of megabytes. pybase64, when installed,
+    is a SIMD encoder several times faster than the stdlib's and produces the
+    same output; it is an optional accelerator resolved on first use, so
+    environments without it (e.g. Pyodide) keep base64.b64encode.
+    """
+    global _b64encode
+    if _b64encode is None:
+        try:
+            from pybase64 import b64encode as encoder  # type: ignore
+        except ImportError:
+            encoder = base64.b64encode
+        _b64encode = encoder
+    return _b64encode(data).decode('ascii')
+
+
 def serialize_ndarray(obj, *, force_json_markers):
     """
     Encode a NumPy ndarray. Arrow IPC (compact, lossless) by default; JSON when
@@ -381,14 +496,12 @@ def serialize_ndarray(obj, *, force_json_markers):
         ) from exc
     try:
         original_shape = list(obj.shape) if hasattr(obj, 'shape') else None
-        flat = obj.flatten() if hasattr(obj, 'ndim') and obj.ndim != 1 else obj
-        arr = pa.array(flat)
-        table = pa.Table.from_arrays([arr], names=['value'])
-        sink = pa.BufferOutputStream()
-        with pa.ipc.new_stream(sink, table.schema) as writer:
-            writer.write_table(table)
-        buf = sink.getvalue()
-        b64 = base64.b64encode(buf.to_pybytes()).decode('ascii')
+        # ravel() is a view for C-contiguous input and only copies otherwise;
+        # flatten() always copied. pa.array wraps numeric buffers without copying.
+        flat = obj.ravel() if hasattr(obj, 'ndim') and obj.ndim != 1 else obj
+        buf = _single_column_ipc_stream(pa, pa.array(flat))
+        # pyarrow Buffers expose the buffer protocol; encode without a bytes copy.
+        b64 = _b64encode_ascii(buf)
         return {
             '__tywrap__': 'ndarray',
             'codecVersion': CODEC_VERSION,
@@ -492,14 +605,16 @@ def serialize_ndarray_json(obj):
 
 def serialize_dataframe(obj, *, force_json_markers):
     """
-    Encode a pandas DataFrame. Feather/Arrow-IPC (uncompressed, so apache-arrow
+    Encode a pandas DataFrame. Arrow IPC stream (uncompressed, so apache-arrow
     in JS can read it) by default; JSON when force_json_markers is set.
+
+    The stream format carries the same schema (including pandas metadata) as a
+    Feather file without the random-access footer; tableFromIPC reads either.
     """
     if force_json_markers:
         return serialize_dataframe_json(obj)
     try:
         import pyarrow as pa  # type: ignore
-        import pyarrow.feather as feather  # type: ignore
     except Exception as exc:
         raise RuntimeError(
             'Arrow encoding unavailable for pandas.DataFrame; install pyarrow or set TYWRAP_CODEC_FALLBACK=json to enable JSON fallback'
@@ -507,9 +622,11 @@ def serialize_dataframe(obj, *, force_json_markers):
     try:
         table = pa.Table.from_pandas(obj)  # type: ignore
         sink = pa.BufferOutputStream()
-        feather.write_feather(table, sink, compression='uncompressed')
+        with pa.ipc.new_stream(sink, table.schema, options=_get_ipc_write_options(pa)) as writer:
+            writer.write_table(table)
         buf = sink.getvalue()
-        b64 = base64.b64encode(buf.to_pybytes()).decode('ascii')
+        # pyarrow Buffers expose the buffer protocol; encode without a bytes copy.
+        b64 = _b64encode_ascii(buf)
         return {
             '__tywrap__': 'dataframe',
             'codecVersion': CODEC_VERSION,
@@ -579,13 +696,9 @@ def serialize_series(obj, *, force_json_markers):
             'Arrow encoding unavailable for pandas.Series; install pyarrow or set TYWRAP_CODEC_FALLBACK=json to enable JSON fallback'
         ) from exc
     try:
-        arr = pa.Array.from_pandas(obj)  # type: ignore
-        table = pa.Table.from_arrays([arr], names=['value'])
-        sink = pa.BufferOutputStream()
-        with pa.ipc.new_stream(sink, table.schema) as writer:
-            writer.write_table(table)
-        buf = sink.getvalue()
-        b64 = base64.b64encode(buf.to_pybytes()).decode('ascii')
+        buf = _single_column_ipc_stream(pa, pa.Array.from_pandas(obj))  # type: ignore
+        # pyarrow Buffers expose the buffer protocol; encode without a bytes copy.
+        b64 = _b64encode_ascii(buf)
         return {
             '__tywrap__': 'series',
             'codecVersion': CODEC_VERSION,
@@ -647,6 +760,8 @@ def _validate_pandas_json_index(index, pd, container_name):
 
 def _json_object_key(value):
     """Return json.dumps' object-key spelling, or None for unsupported keys."""
+    if type(value) is str:
+        return value
     try:
         encoded = json.dumps({value: None})
     except (TypeError, ValueError):
@@ -860,6 +975,11 @@ def serialize_sklearn_estimator(obj):
     # failing opaquely on the whole dict. allow_nan=False also rejects NaN/Inf
     # params here for parity with the response codec.
     for key, value in params.items():
+        if type(value) in (type(None), bool, int, str) or (
+            type(value) is float and math.isfinite(value)
+        ):
+            # Plain JSON scalars (most params) cannot fail the probe; skip the encode.
+            continue
         try:
             json.dumps(value, allow_nan=False)
         except (TypeError, ValueError) as exc:
@@ -902,8 +1022,24 @@ def serialize_pydantic(obj):
         raise RuntimeError(f'model_dump failed: {exc}') from exc
 
 
+# Exact stdlib types -> JSON-safe coercion. Resolves the common case with one dict
+# lookup; subclasses (e.g. pandas.Timestamp) and concrete Path flavours fall through
+# to the isinstance chain in serialize_stdlib, which stays the reference order.
+_STDLIB_ENCODERS = {
+    dt.datetime: dt.datetime.isoformat,
+    dt.date: dt.date.isoformat,
+    dt.time: dt.time.isoformat,
+    dt.timedelta: dt.timedelta.total_seconds,
+    decimal.Decimal: str,
+    uuid.UUID: str,
+}
+
+
 def serialize_stdlib(obj):
     """Coerce common stdlib scalar types to JSON-safe forms; None otherwise."""
+    encoder = _STDLIB_ENCODERS.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
     if isinstance(obj, dt.datetime):
         return obj.isoformat()
     if isinstance(obj, dt.date):
@@ -923,6 +1059,13 @@ def serialize_stdlib(obj):
 
 _NO_SCIENTIFIC = object()
 
+# type -> scientific codec kind ('ndarray', 'dataframe', 'series', 'sparse', 'torch',
+# 'sklearn') or None. A type can only exist once its defining package is imported,
+# and its base classes never change, so a resolved kind stays valid for the life of
+# the process. Bounded so dynamically created classes cannot grow it without limit.
+_SCIENTIFIC_KINDS = {}
+_SCIENTIFIC_KINDS_MAX = 4096
+
 
 def _check_serialize_depth(depth, path):
     if depth > MAX_SERIALIZE_DEPTH:
@@ -940,41 +1083,85 @@ def _check_serialize_nodes(nodes, path):
         )
 
 
-def _serialize_scientific(obj, *, force_json_markers, torch_allow_copy, depth, path):
-    """Serialize a supported scientific value, or return _NO_SCIENTIFIC."""
-    package = type(obj).__module__.split('.', 1)[0]
-
-    if package == 'numpy' and 'numpy' in sys.modules:
-        if is_numpy_array(obj):
-            _check_serialize_depth(depth, path)
-            return serialize_ndarray(obj, force_json_markers=force_json_markers)
-    elif package == 'pandas' and 'pandas' in sys.modules:
-        if is_pandas_dataframe(obj):
-            _check_serialize_depth(depth, path)
-            return serialize_dataframe(obj, force_json_markers=force_json_markers)
-        if is_pandas_series(obj):
-            _check_serialize_depth(depth, path)
-            return serialize_series(obj, force_json_markers=force_json_markers)
-    elif package == 'scipy' and 'scipy.sparse' in sys.modules:
-        if is_scipy_sparse(obj):
-            _check_serialize_depth(depth, path)
-            return serialize_sparse_matrix(obj)
-    elif package == 'torch' and 'torch' in sys.modules:
-        if is_torch_tensor(obj):
-            _check_serialize_depth(depth, path)
-            _check_serialize_depth(depth + 1, _serialize_path(path, 'value'))
-            return serialize_torch_tensor(
-                obj, force_json_markers=force_json_markers, torch_allow_copy=torch_allow_copy
+def _resolve_scientific_kind(cls):
+    """Classify a type for _serialize_scientific (uncached; see _scientific_kind)."""
+    package = cls.__module__.split('.', 1)[0]
+
+    if package == 'numpy':
+        np = sys.modules.get('numpy')
+        if np is not None and issubclass(cls, np.ndarray):
+            return 'ndarray'
+    elif package == 'pandas':
+        pd = sys.modules.get('pandas')
+        if pd is not None:
+            if issubclass(cls, pd.DataFrame):
+                return 'dataframe'
+            if issubclass(cls, pd.Series):
+                return 'series'
+    elif package == 'scipy':
+        sp = sys.modules.get('scipy.sparse')
+        if sp is not None:
+            sparse_bases = tuple(
+                base
+                for base in (getattr(sp, 'spmatrix', None), getattr(sp, 'sparray', None))
+                if isinstance(base, type)
             )
-    elif 'sklearn.base' in sys.modules and is_sklearn_estimator(obj):
+            if sparse_bases and issubclass(cls, sparse_bases):
+                return 'sparse'
+    elif package == 'torch':
+        torch = sys.modules.get('torch')
+        if torch is not None and issubclass(cls, torch.Tensor):
+            return 'torch'
+    else:
         # No package gate here, unlike the branches above: subclassing
         # BaseEstimator is sklearn's documented extension point, so user-defined
         # estimators live outside the 'sklearn' package and must still get the
         # estimator serializer (and its param-naming errors).
-        _check_serialize_depth(depth, path)
-        return serialize_sklearn_estimator(obj)
+        sklearn_base = sys.modules.get('sklearn.base')
+        if sklearn_base is not None and issubclass(cls, sklearn_base.BaseEstimator):
+            return 'sklearn'
+    return None
+
+
+def _scientific_kind(cls):
+    """
+    Return the scientific codec kind for a type, resolving it once per type.
+
+    Why: serialize() asks this for every non-JSON-native value it visits; a dict
+    lookup replaces the per-value module probes and isinstance checks.
+    """
+    try:
+        return _SCIENTIFIC_KINDS[cls]
+    except KeyError:
+        pass
+    kind = _resolve_scientific_kind(cls)
+    if len(_SCIENTIFIC_KINDS) >= _SCIENTIFIC_KINDS_MAX:
+        _SCIENTIFIC_KINDS.clear()
+    _SCIENTIFIC_KINDS[cls] = kind
+    return kind
+
 
-    return _NO_SCIENTIFIC
+def _serialize_scientific(obj, *, force_json_markers, torch_allow_copy, depth, path):
+    """Serialize a supported scientific value, or return _NO_SCIENTIFIC."""
+    kind = _scientific_kind(type(obj))
+    if kind is None:
+        return _NO_SCIENTIFIC
+
+    _check_serialize_depth(depth, path)
+    if kind == 'ndarray':
+        return serialize_ndarray(obj, force_json_markers=force_json_markers)
+    if kind == 'dataframe':
+        return serialize_dataframe(obj, force_json_markers=force_json_markers)
+    if kind == 'series':
+        return serialize_series(obj, force_json_markers=force_json_markers)
+    if kind == 'sparse':
+        return serialize_sparse_matrix(obj)
+    if kind == 'torch':
+        _check_serialize_depth(depth + 1, _serialize_path(path, 'value'))
+        return serialize_torch_tensor(
+            obj, force_json_markers=force_json_markers, torch_allow_copy=torch_allow_copy
+        )
+    return serialize_sklearn_estimator(obj)
 
 
 def _serialize_path(base, key):
@@ -991,21 +1178,25 @@ def _invalid_key_path(base, key):
     return f'{base}[{key!r}]'
 
 
+# Exact types (subclasses excluded) that serialize() passes through or descends
+# into without any codec dispatch.
+_JSON_SCALAR_TYPES = frozenset((type(None), bool, int, float, str))
+_JSON_CONTAINER_TYPES = frozenset((dict, list, tuple))
+
+
 def _needs_serialize_visit(value):
     """Return whether value needs container or scientific traversal work."""
-    if type(value) in (type(None), bool, int, float, str):
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
         return False
-    if type(value) in (dict, list, tuple):
-        return True
-    package = type(value).__module__.split('.', 1)[0]
-    if package in ('numpy', 'pandas', 'scipy', 'torch'):
+    if value_type in _JSON_CONTAINER_TYPES:
         return True
-    return 'sklearn.base' in sys.modules and is_sklearn_estimator(value)
+    return _scientific_kind(value_type) is not None
 
 
 def _serialize_leaf(value):
     """Apply non-container conversions without allocating a traversal frame."""
-    if type(value) in (type(None), bool, int, float, str):
+    if type(value) in _JSON_SCALAR_TYPES:
         return value
     pydantic_value = serialize_pydantic(value)
     if pydantic_value is not _NO_PYDANTIC:
@@ -1052,9 +1243,10 @@ def serialize(obj, *, force_json_markers, torch_allow_copy=False):
                     f'keys must be str, int, float, bool or None, not '
                     f'{type(item_key).__name__} at {invalid_path}'
                 )
-            child_key = _json_object_key(item_key)
-            child_path = _serialize_path(path, child_key)
             if _needs_serialize_visit(item):
+                # The child path only feeds error messages of nested visits, so
+                # primitive leaves (the common case) never pay to build it.
+                child_path = _serialize_path(path, _json_object_key(item_key))
                 stack.append(('visit', item, depth + 1, child_path, output, item_key))
             else:
                 output[item_key] = _serialize_leaf(item)
@@ -1107,7 +1299,7 @@ def serialize(obj, *, force_json_markers, torch_allow_copy=False):
             continue
 
         container_type = type(current)
-        if container_type in (dict, list, tuple):
+        if container_type in _JSON_CONTAINER_TYPES:
             _check_serialize_depth(depth, path)
             visited_nodes += 1
             _check_serialize_nodes(visited_nodes, path)
@@ -1153,21 +1345,41 @@ def _is_nan_or_inf(value):
 
 
 def _is_numpy_scalar(obj):
-    try:
-        import numpy as np
-    except ImportError:
+    """Return whether obj is a NumPy scalar or 0-d array without importing NumPy."""
+    np = sys.modules.get('numpy')
+    if np is None:
         return False
     return isinstance(obj, (np.generic, np.ndarray)) and obj.ndim == 0
 
 
 def _is_pandas_scalar(obj):
-    try:
-        import pandas as pd
-    except ImportError:
+    """Return whether obj is a pandas Timestamp/Timedelta/NaT without importing pandas."""
+    pd = sys.modules.get('pandas')
+    if pd is None:
         return False
     return isinstance(obj, (pd.Timestamp, pd.Timedelta, type(pd.NaT)))
 
 
+def _bytes_envelope(obj):
+    return {
+        '__type__': 'bytes',
+        'encoding': 'base64',
+        'data': _b64encode_ascii(obj),
+    }
+
+
+# Exact types the default encoder converts without any probing. None of them can
+# be a numpy/pandas scalar, so resolving them before those checks is order-safe;
+# subclasses still take the full path below.
+_DEFAULT_ENCODERS = {
+    **_STDLIB_ENCODERS,
+    bytes: _bytes_envelope,
+    bytearray: _bytes_envelope,
+    set: list,
+    frozenset: list,
+}
+
+
 def make_default_encoder(*, allow_nan):
     """
     Build a json.dumps default= encoder matching BridgeCodec's value handling.
@@ -1177,6 +1389,10 @@ def make_default_encoder(*, allow_nan):
     """
 
     def default_encoder(obj):
+        encoder = _DEFAULT_ENCODERS.get(type(obj))
+        if encoder is not None:
+            return encoder(obj)
+
         # numpy/pandas scalars first (need .item() extraction).
         if _is_numpy_scalar(obj):
             extracted = obj.item()
@@ -1185,28 +1401,20 @@ def make_default_encoder(*, allow_nan):
             return extracted
 
         if _is_pandas_scalar(obj):
-            try:
-                import pandas as pd
-            except ImportError:
-                pass
-            else:
-                if obj is pd.NaT or (hasattr(pd, 'isna') and pd.isna(obj)):
-                    return None
-                if isinstance(obj, pd.Timestamp):
-                    return obj.isoformat()
-                if isinstance(obj, pd.Timedelta):
-                    return obj.total_seconds()
+            pd = sys.modules['pandas']
+            if obj is pd.NaT or (hasattr(pd, 'isna') and pd.isna(obj)):
+                return None
+            if isinstance(obj, pd.Timestamp):
+                return obj.isoformat()
+            if isinstance(obj, pd.Timedelta):
+                return obj.total_seconds()
 
         stdlib_value = serialize_stdlib(obj)
         if stdlib_value is not None:
             return stdlib_value
 
         if isinstance(obj, (bytes, bytearray)):
-            return {
-                '__type__': 'bytes',
-                'encoding': 'base64',
-                'data': base64.b64encode(obj).decode('ascii'),
-            }
+            return _bytes_envelope(obj)
 
         model_dump = getattr(obj, 'model_dump', None)
         if callable(model_dump):
@@ -1235,7 +1443,19 @@ def encode_value(value, *, allow_nan):
     BridgeCodec's "Cannot serialize NaN..." wording so error parity holds.
     """
     try:
-        return json.dumps(value, default=make_default_encoder(allow_nan=allow_nan), allow_nan=allow_nan)
+        # Compact separators keep payloads small and use the same layout as
+        # orjson. That alone does not make the two encoders agree: orjson writes
+        # non-ASCII text raw and formats some floats differently, so
+        # python_bridge only hands it values it encodes byte-for-byte like this
+        # (see _fast_encode there). ensure_ascii stays on: lone surrogates
+        # (e.g. surrogateescape'd paths) must remain escapable, since callers
+        # UTF-8 encode the result.
+        return json.dumps(
+            value,
+            default=make_default_encoder(allow_nan=allow_nan),
+            allow_nan=allow_nan,
+            separators=(',', ':'),
+        )
     except ValueError as exc:
         error_msg = str(exc).lower()
         # json.dumps(allow_nan=False) rejects NaN/Infinity with a ValueError whose
@@ -1263,12 +1483,16 @@ class BridgeCodec:
 
     def encode(self, value):
         result = encode_value(value, allow_nan=self.allow_nan)
-        if len(result.encode('utf-8')) > self.max_payload_bytes:
+        # encode_value emits ASCII only, so the character count is the byte count.
+        if len(result) > self.max_payload_bytes:
             raise CodecError(f'Payload exceeds {self.max_payload_bytes} bytes')
         return result
 
     def decode(self, payload):
-        if len(payload.encode('utf-8')) > self.max_payload_bytes:
+        # str.isascii() is O(1) in CPython; only non-ASCII text needs a UTF-8
+        # encode to learn its byte length.
+        payload_bytes = len(payload) if payload.isascii() else len(payload.encode('utf-8'))
+        if payload_bytes > self.max_payload_bytes:
             raise CodecError(f'Payload exceeds {self.max_payload_bytes} bytes')
         try:
             return json.loads(payload)
@@ -1326,6 +1550,14 @@ def require_str(params, key):
     return value
 
 
+# Shared read-only stand-ins for absent args/kwargs/params at the dispatch call
+# sites, so small requests (meta probes, zero-argument calls) do not allocate a
+# fresh container each time. Read-only so no handler can leak state into the next
+# request through them. The public coerce_* helpers still return fresh containers.
+_EMPTY_LIST = ()
+_EMPTY_DICT = MappingProxyType({})
+
+
 def coerce_list(value, key):
     if value is None:
         return []
@@ -1353,8 +1585,16 @@ def handle_call(
 ):
     module_name = require_str(params, 'module')
     function_name = require_str(params, 'functionName')
-    args = deserialize(coerce_list(params.get('args'), 'args'), has_envelope_markers=has_envelope_markers)
-    kwargs = deserialize(coerce_dict(params.get('kwargs'), 'kwargs'), has_envelope_markers=has_envelope_markers)
+    raw_args = params.get('args')
+    raw_kwargs = params.get('kwargs')
+    args = deserialize(
+        _EMPTY_LIST if raw_args is None else coerce_list(raw_args, 'args'),
+        has_envelope_markers=has_envelope_markers,
+    )
+    kwargs = deserialize(
+        _EMPTY_DICT if raw_kwargs is None else coerce_dict(raw_kwargs, 'kwargs'),
+        has_envelope_markers=has_envelope_markers,
+    )
     mod = import_allowed_module(module_name, allowed_modules)
     # function_name may be dotted ('Class.method') for @classmethod/@staticmethod
     # calls, which the generated wrapper routes through call() rather than an
@@ -1436,7 +1676,8 @@ def dispatch_request(
     method = msg.get('method')
     if not isinstance(method, str):
         raise ProtocolError('Missing method')
-    params = coerce_dict(msg.get('params'), 'params')
+    raw_params = msg.get('params')
+    params = _EMPTY_DICT if raw_params is None else coerce_dict(raw_params, 'params')
     if method == 'call':
         result = handle_call(
             params,
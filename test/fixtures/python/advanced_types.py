@@ -4,53 +4,30 @@ Tests Python 3.9-3.12 typing features and complex type annotations.
 """
 
 from __future__ import annotations
+import bisect
 import sys
 from typing import (
     Any, Dict, List, Set, Tuple, Optional, Union, Callable, Generic, TypeVar, 
     ClassVar, overload
 )
 
+from typing import (
+    Protocol, runtime_checkable, Final, Literal, Annotated, TypedDict, TypeAlias,
+    ParamSpec,
+)
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, Required, TypeVarTuple, Unpack
 try:
-    from typing import Protocol, runtime_checkable, Final, Literal, Annotated
-except ImportError:
-    # Fallbacks for older Python versions
-    class Protocol: pass  # type: ignore
-    def runtime_checkable(cls): return cls  # type: ignore
-    def Final(x): return x  # type: ignore
-    def Literal(*args): return str  # type: ignore
-    def Annotated(tp, *args): return tp  # type: ignore
-
-try:
-    from typing import TypedDict
-except ImportError:
-    try:
-        from typing_extensions import TypedDict  # type: ignore
-    except ImportError:
-        class TypedDict: pass  # type: ignore
-
-try:
-    from typing import NotRequired, Required
-except ImportError:
-    try:
+    # Prefer the backported variadic markers when installed: the IR spells their
+    # Unpack as Unpack[Ts] rather than the stdlib's *Ts.
+    from typing_extensions import ParamSpec, TypeVarTuple, Unpack  # type: ignore
+    if sys.version_info < (3, 11):
         from typing_extensions import NotRequired, Required  # type: ignore
-    except ImportError:
-        # Fallbacks for older Python versions
+except ImportError:
+    if sys.version_info < (3, 11):
+        # Minimal fallbacks for Python 3.10 without typing_extensions
         def NotRequired(x): return x  # type: ignore
         def Required(x): return x  # type: ignore
-
-try:
-    from typing import TypeAlias
-except ImportError:
-    def TypeAlias(x): return x  # type: ignore
-try:
-    from typing_extensions import ParamSpec, TypeVarTuple, Unpack
-except ImportError:
-    # Fallbacks for systems without typing_extensions
-    try:
-        from typing import ParamSpec, TypeVarTuple, Unpack  # Python 3.10+
-    except ImportError:
-        # Create minimal fallbacks
-        ParamSpec = TypeVar  # type: ignore
         class TypeVarTuple:  # type: ignore
             def __init__(self, name): pass
         def Unpack(x): return x  # type: ignore
@@ -205,10 +182,20 @@ async def async_fetch_data(
     headers: Optional[Mapping[str, str]] = None
 ) -> AsyncIterator[bytes]:
     """Asynchronously fetch data from URLs."""
-    for url in urls:
+    async def fetch(url: str) -> bytes:
         # Simulate async operation
         await asyncio.sleep(0.1)
-        yield b"mock_data"
+        return b"mock_data"
+
+    # Start every fetch up front; results are still yielded in input order.
+    tasks = [asyncio.create_task(fetch(url)) for url in urls]
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        # Closing the iterator early must not leave fetches running.
+        for task in tasks:
+            task.cancel()
 
 def complex_callback(
     func: Callable[P, T],
@@ -280,8 +267,7 @@ class SortedContainer(Generic[T]):
     
     def add(self, item: T) -> None:
         # Insert in sorted order
-        self._items.append(item)
-        self._items.sort()
+        bisect.insort(self._items, item)
     
     def get_all(self) -> List[T]:
         return self._items.copy()
@@ -310,12 +296,14 @@ class TreeNode:
         self.children.append(child)
     
     def find(self, value: int) -> Optional[TreeNode]:
-        if self.value == value:
-            return self
-        for child in self.children:
-            result = child.find(value)
-            if result:
-                return result
+        # Iterative pre-order DFS: no recursion limit on deep trees. Children are
+        # pushed reversed so the leftmost match is still found first.
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.value == value:
+                return node
+            stack.extend(reversed(node.children))
         return None
 
 
@@ -349,20 +337,24 @@ class ValidationError(Exception):
         super().__init__(message)
         self.field = field
 
+_MISSING = object()
+
 def validate_person_data(data: Dict[str, Any]) -> Person:
     """Validate and create Person from dictionary data."""
-    if 'name' not in data:
+    name = data.get('name', _MISSING)
+    if name is _MISSING:
         raise ValidationError("Name is required", "name")
-    if 'age' not in data:
+    raw_age = data.get('age', _MISSING)
+    if raw_age is _MISSING:
         raise ValidationError("Age is required", "age")
     
     try:
-        age = int(data['age'])
+        age = int(raw_age)
     except (ValueError, TypeError):
         raise ValidationError("Age must be a valid integer", "age")
     
     return Person(
-        name=str(data['name']),
+        name=str(name),
         age=age,
         email=data.get('email')
     )
@@ -12,11 +12,13 @@ async def fetch_data(url: str) -> str:
 
 async def process_items(items: List[str]) -> List[str]:
     """Process items asynchronously."""
-    results = []
-    for item in items:
+
+    async def process(item: str) -> str:
         await asyncio.sleep(0.01)
-        results.append(item.upper())
-    return results
+        return item.upper()
+
+    # gather runs the items concurrently and keeps results in input order.
+    return await asyncio.gather(*(process(item) for item in items))
 
 
 async def async_generator(count: int) -> AsyncIterator[int]:
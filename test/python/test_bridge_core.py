@@ -281,7 +281,7 @@ def test_nested_set_uses_the_same_default_encoding_as_a_root_set() -> None:
         allow_nan=False,
     )
 
-    assert nested_json == f'{{"outer": {{"values": {root_json}}}}}'
+    assert nested_json == f'{{"outer":{{"values":{root_json}}}}}'
 
 
 def test_model_dump_information_error_preserves_origin_behavior() -> None:
@@ -333,6 +333,21 @@ def test_deserialize_still_decodes_bytes_envelope_when_markers_are_present() ->
     assert deserialize(value, has_envelope_markers=True) == {'data': b'hello'}
 
 
+def test_deserialize_decodes_envelopes_nested_beyond_recursion_limit() -> None:
+    value = inner = []
+    for _ in range(sys.getrecursionlimit() + 100):
+        child = []
+        inner.append(child)
+        inner = child
+    inner.append({'__tywrap_bytes__': True, 'b64': 'aGVsbG8='})
+
+    result = deserialize(value, has_envelope_markers=True)
+
+    while result and isinstance(result[0], list):
+        result = result[0]
+    assert result == [b'hello']
+
+
 def test_stateful_instance_methods_are_unknown() -> None:
     with pytest.raises(ProtocolError, match='Unknown method: instantiate'):
         dispatch_request(
@@ -658,3 +673,14 @@ def test_dataframe_json_rejects_unsafe_numpy_integer_in_object_column() -> None:
         serialize_dataframe_json(
             pd.DataFrame({'value': pd.Series([np.int64(2**53)], dtype=object)})
         )
+
+
+def test_public_coerce_helpers_return_fresh_containers() -> None:
+    """coerce_list/coerce_dict are public: absent values give new mutable containers."""
+    first = bridge_core.coerce_list(None, 'args')
+    first.append(1)
+    assert bridge_core.coerce_list(None, 'args') == []
+
+    mapping = bridge_core.coerce_dict(None, 'kwargs')
+    mapping['leak'] = True
+    assert bridge_core.coerce_dict(None, 'kwargs') == {}
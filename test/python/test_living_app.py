@@ -0,0 +1,300 @@
+"""Regression tests for the living-app example's CSV helpers.
+
+Run with: pytest test/python/test_living_app.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+import numpy as np  # noqa: E402  (a pandas dependency)
+pytest.importorskip('pydantic')
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'examples' / 'living-app'))
+
+from living_app import app  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the parsed-CSV cache out of the user's cache directory."""
+    path = tmp_path / 'cache'
+    monkeypatch.setenv('LIVING_APP_CACHE_DIR', str(path))
+    return path
+
+
+MIXED_CSV = (
+    b'ts,day,clock,empty,flag,count,label\n'
+    b'2024-01-01 00:00:00,2024-01-01,12:00:00,,True,1,x\n'
+    b'2024-01-02 00:00:00,2024-01-02,13:00:00,,,,\n'
+)
+
+
+@pytest.mark.parametrize(
+    'data, columns',
+    [
+        (MIXED_CSV, ['day', 'label']),
+        (b'a,b,c\n1,2,3\n4,5\n', ['a', 'c']),  # ragged row
+        (b'a,a,b\n1,2,3\n', ['b']),  # duplicate header
+        (b'a,,b\n1,2,3\n', ['b']),  # empty header name
+        (b'big,small\n9223372036854775808,1\n1,2\n', ['big']),  # beyond int64
+        (b'a,b\n', ['b']),  # header only
+    ],
+    ids=['mixed', 'ragged', 'duplicate-header', 'empty-header', 'uint64', 'header-only'],
+)
+def test_read_csv_matches_pandas_dtypes(tmp_path: Path, data: bytes, columns: list[str]) -> None:
+    """Temporal text, all-empty columns, gaps and files Arrow cannot parse like pandas
+    read exactly as pd.read_csv reads them, cold and from the cache."""
+    path = tmp_path / 'data.csv'
+    path.write_bytes(data)
+    expected = pd.read_csv(path)
+
+    pd.testing.assert_frame_equal(app._read_csv(str(path)), expected)
+    pd.testing.assert_frame_equal(app._read_csv(str(path), columns=columns), expected[columns])
+    pd.testing.assert_frame_equal(app._load_csv(str(path)), expected)
+    pd.testing.assert_frame_equal(app._load_csv(str(path)), expected)
+    pd.testing.assert_frame_equal(app._read_csv_sample(str(path), 50), expected)
+
+
+def test_read_csv_sample_types_columns_from_every_row(tmp_path: Path) -> None:
+    """Values outside the sampled rows still decide the column dtypes."""
+    rows = [f'{i},{i},{i % 2 == 0}' for i in range(500)]
+    rows[-1] = 'text,,'  # the 50-row sample below does not include this row
+    path = tmp_path / 'late.csv'
+    path.write_text('ints,gaps,flags\n' + '\n'.join(rows) + '\n')
+
+    sample = app._read_csv_sample(str(path), 50)
+    expected = pd.read_csv(path).sample(n=50, random_state=0)
+
+    assert 499 not in sample.index
+    pd.testing.assert_frame_equal(sample, expected)
+
+
+def test_pairwise_pearson_matches_dataframe_corr() -> None:
+    """The correlation kernel agrees with DataFrame.corr() on pairwise-complete rows."""
+    rng = np.random.default_rng(0)
+    arr = rng.normal(size=(400, 6))
+    arr[:, 1] += arr[:, 0]
+    arr[rng.random(arr.shape) < 0.1] = np.nan
+    arr[:, 5] = 1.0  # constant: no defined coefficient
+
+    iu, ju, vals = app._pairwise_pearson_upper(arr)
+    expected = pd.DataFrame(arr).corr().to_numpy()
+
+    assert all(5 not in pair for pair in zip(iu.tolist(), ju.tolist()))
+    assert len(vals) == 10
+    np.testing.assert_allclose(vals, expected[iu, ju], rtol=0, atol=1e-12)
+
+
+def _without_dtypes(dump: dict) -> dict:
+    for profile in dump['profiles']:
+        profile.pop('dtype')  # reported with each engine's own dtype names
+    return dump
+
+
+@pytest.mark.parametrize('sample_rows', [None, 100])
+def test_polars_engine_matches_pandas_profile(tmp_path: Path, sample_rows: int | None) -> None:
+    """Both engines sample the same rows and report the same statistics."""
+    pytest.importorskip('polars')
+    events = app.write_synthetic_events_csv(str(tmp_path / 'events.csv'), rows=2000, seed=1)
+    tokens = tmp_path / 'tokens.csv'
+    tokens.write_text(
+        'k,v,w\n'
+        + ''.join(
+            f"{['a', 'b', 'NA', 'None', ''][i % 5]},{i if i % 7 else 'nan'},{'xy'[i % 2]}\n"
+            for i in range(300)
+        )
+    )
+
+    for path in (events, str(tokens)):
+        results = [
+            app.profile_csv(
+                path, app.ProfileConfig(sample_rows=sample_rows, engine=engine)
+            ).model_dump()
+            for engine in ('pandas', 'polars')
+        ]
+        assert _without_dtypes(results[0]) == _without_dtypes(results[1])
+
+
+def test_polars_engine_matches_pandas_drift(tmp_path: Path) -> None:
+    pytest.importorskip('polars')
+    baseline = app.write_synthetic_events_csv(str(tmp_path / 'b.csv'), rows=2000, seed=1)
+    current = app.write_synthetic_events_csv(str(tmp_path / 'c.csv'), rows=2000, seed=2, drift=0.5)
+
+    pandas_report, polars_report = (
+        app.drift_report(baseline, current, app.DriftConfig(engine=engine)).model_dump()
+        for engine in ('pandas', 'polars')
+    )
+    assert pandas_report == polars_report
+
+
+def test_polars_engine_types_columns_from_every_row(tmp_path: Path) -> None:
+    """A float or text cell far past Polars' default inference window still parses."""
+    pytest.importorskip('polars')
+    rows = [[str(i), str(i % 3), 'x'] for i in range(600)]
+    rows[300][0] = '1.5'
+    rows[500][1] = 'text'
+    baseline = tmp_path / 'late.csv'
+    baseline.write_text('floats,mixed,label\n' + ''.join(','.join(r) + '\n' for r in rows))
+    current = tmp_path / 'ints.csv'
+    current.write_text('floats,mixed,label\n' + ''.join(f'{i},{i % 3},y\n' for i in range(600)))
+
+    profiles = [
+        app.profile_csv(str(baseline), app.ProfileConfig(sample_rows=None, engine=engine))
+        for engine in ('pandas', 'polars')
+    ]
+    reports = [
+        app.drift_report(str(baseline), str(current), app.DriftConfig(engine=engine))
+        for engine in ('pandas', 'polars')
+    ]
+    assert profiles[0].profiles[1].kind == 'categorical'  # 'mixed' is text after row 500
+    assert _without_dtypes(profiles[0].model_dump()) == _without_dtypes(profiles[1].model_dump())
+    assert reports[0].model_dump() == reports[1].model_dump()
+
+
+def test_cached_loads_match_cold_loads(tmp_path: Path, cache_dir: Path) -> None:
+    """Warm runs read the cache and report exactly what cold runs report."""
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'events.csv'
+    rows = [f'2024-01-{i % 28 + 1:02d} 10:00:00,{i * 0.1},{"ab"[i % 2]},' for i in range(200)]
+    rows[3] += 'True'  # a bool column with gaps
+    path.write_text('ts,value,key,flag\n' + '\n'.join(rows) + '\n')
+    csv = str(path)
+    profile_config = app.ProfileConfig(sample_rows=None)
+
+    cold_profile = app.profile_csv(csv, profile_config).model_dump()
+    assert list(cache_dir.iterdir())
+    warm_profile = app.profile_csv(csv, profile_config).model_dump()
+    warm_drift = app.drift_report(csv, csv, app.DriftConfig()).model_dump()
+    for entry in cache_dir.iterdir():
+        entry.unlink()
+    cold_drift = app.drift_report(csv, csv, app.DriftConfig()).model_dump()
+
+    assert warm_profile == cold_profile
+    assert warm_drift == cold_drift
+    assert [c['column'] for c in warm_drift['categorical']] == ['flag', 'key', 'ts']
+    pd.testing.assert_frame_equal(app._load_csv(csv), pd.read_csv(path))
+
+
+def test_cache_is_invalidated_by_same_size_same_mtime_rewrite(tmp_path: Path) -> None:
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'values.csv'
+    path.write_text('value\n1\n2\n')
+    before = path.stat()
+    assert app._load_csv(str(path))['value'].tolist() == [1, 2]
+
+    path.write_text('value\n3\n4\n')
+    os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+    assert app._load_csv(str(path))['value'].tolist() == [3, 4]
+
+
+@pytest.mark.filterwarnings('ignore:invalid value encountered:RuntimeWarning')
+def test_numeric_min_max_keep_infinities(tmp_path: Path) -> None:
+    path = tmp_path / 'inf.csv'
+    path.write_text('full,gappy\n1.5,inf\n-inf,\ninf,2.5\n0,-inf\n')
+
+    profile = app.profile_csv(str(path), app.ProfileConfig(sample_rows=None))
+    full, gappy = (p.numeric for p in profile.profiles)
+
+    assert (full.min, full.max) == (float('-inf'), float('inf'))
+    assert (gappy.min, gappy.max) == (float('-inf'), float('inf'))
+
+
+@pytest.mark.parametrize('block_size', [None, 64])
+def test_streamed_drift_stats_match_pandas_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, block_size: int | None
+) -> None:
+    """Arrow-streamed chunks give pandas' per-chunk statistics, including when a later
+    block retypes a column (64-byte blocks) and the scan restarts on pandas."""
+    pytest.importorskip('pyarrow')
+    if block_size is not None:
+        options = app._csv_arrow_options
+
+        def small_blocks(*args, **kwargs):
+            read_options, convert_options = options(*args, **kwargs)
+            read_options.block_size = block_size
+            return read_options, convert_options
+
+        monkeypatch.setattr(app, '_csv_arrow_options', small_blocks)
+    rows = [
+        f'{i},{i if i != 40 else 1.5},{i % 4 if i != 50 else "text"},'
+        f'{"" if i == 30 else i % 2 == 0},2024-01-{i % 28 + 1:02d} 10:00:00,{"ab"[i % 2]}'
+        for i in range(60)
+    ]
+    rows[12] = '12,0.1,2,,,'
+    path = tmp_path / 'stream.csv'
+    path.write_text('ints,floats,mixed,flags,ts,label\n' + '\n'.join(rows) + '\n')
+    columns = ['ints', 'floats', 'mixed', 'flags', 'ts', 'label']
+
+    means, text = app._stream_stats(str(path), columns, chunksize=7)
+    expected_means, expected_text = app._stream_stats_of(str(path), columns, 7, arrow=False)
+
+    assert means == expected_means
+    assert {c: (list(s.items()), n) for c, (s, n) in text.items()} == {
+        c: (list(s.items()), n) for c, (s, n) in expected_text.items()
+    }
+
+
+def test_top_users_without_reported_columns_reads_only_the_first_rows(
+    tmp_path: Path, cache_dir: Path
+) -> None:
+    path = tmp_path / 'other.csv'
+    path.write_text('a,b\n' + ''.join(f'{i},{i}\n' for i in range(50)))
+
+    top = app.top_users_by_spend(str(path), top_n=3)
+
+    pd.testing.assert_frame_equal(top, pd.read_csv(path)[[]].head(3))
+    assert not cache_dir.exists()
+
+
+def test_csv_is_hashed_only_to_write_or_validate_a_cache_entry(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'values.csv'
+    path.write_text('value,other\n1,a\n2,b\n')
+    csv = str(path)
+    hashed = []
+    cache_key = app._csv_cache_key
+    monkeypatch.setattr(
+        app, '_csv_cache_key', lambda *args: hashed.append(args[0]) or cache_key(*args)
+    )
+
+    app._load_csv(csv, columns=['value'])  # projected, nothing cached: no hash
+    assert hashed == []
+    app._load_csv(csv)  # full parse: hashed for the entry it writes
+    assert hashed == [csv]
+    app._load_csv(csv, columns=['value'])  # size and mtime match: hashed to validate
+    assert hashed == [csv, csv]
+
+    os.utime(path, ns=(0, 0))
+    app._load_csv(csv, columns=['value'])  # stale mtime: missed without hashing
+    assert hashed == [csv, csv]
+
+
+def test_cache_is_trimmed_to_its_size_cap(
+    tmp_path: Path, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip('pyarrow')
+    paths = []
+    for i in range(3):
+        path = tmp_path / f'{i}.csv'
+        path.write_text('value\n' + ''.join(f'{j}\n' for j in range(100)))
+        paths.append(str(path))
+    app._load_csv(paths[0])
+    entry_size = next(cache_dir.iterdir()).stat().st_size
+    monkeypatch.setattr(app, '_CACHE_MAX_BYTES', 2 * entry_size + entry_size // 2)
+
+    app._load_csv(paths[1])
+    for age, path in enumerate(paths[:2]):
+        os.utime(app._cache_file(path), (age, age))  # paths[0] written first
+    app._load_csv(paths[0])  # a hit: now more recently used than paths[1]
+    app._load_csv(paths[2])
+
+    assert sorted(cache_dir.iterdir()) == sorted(app._cache_file(p) for p in (paths[0], paths[2]))
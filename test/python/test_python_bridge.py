@@ -0,0 +1,194 @@
+"""
+Subprocess bridge (runtime/python_bridge.py) unit tests.
+
+Covers the optional orjson fast paths, which must be invisible on the wire: every
+response encodes to the same bytes, and every request parses to the same value,
+whether or not orjson is installed.
+
+Run with: pytest test/python/test_python_bridge.py -v
+"""
+
+from __future__ import annotations
+
+import enum
+import json
+import os
+import subprocess
+import sys
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+RUNTIME_DIR = Path(__file__).parent.parent.parent / 'runtime'
+
+sys.path.insert(0, str(RUNTIME_DIR))
+
+import python_bridge  # noqa: E402
+
+
+class _Color(enum.Enum):
+    RED = 1
+
+
+class _Level(enum.IntEnum):
+    HIGH = 2
+
+
+class _Name(str):
+    pass
+
+
+ENCODE_PAYLOADS = [
+    {'a': 1, 'b': [1, 2, 3], 'c': None, 'd': True, 'e': 'text'},
+    [0.1, -0.0, 0.0, 1e-4, 123456.789, 9.999999999999998e15],
+    [1e16, 1.5e16, 1e-5, 5e-324, 1.7976931348623157e308],
+    ('tuple', 1, 2.5),
+    'héllo wörld',
+    {'ключ': 'value'},
+    '\ud800',
+    uuid.SafeUUID(0),
+    _Color.RED,
+    _Level.HIGH,
+    _Name('subclass'),
+    2**70,
+    float('nan'),
+    [1, float('inf')],
+    datetime(2024, 1, 2, 3, 4, 5),
+    Decimal('1.5'),
+    b'bytes',
+    {1: 'int key'},
+]
+
+
+def _encode(out):
+    try:
+        return python_bridge.encode_response(out)
+    except Exception as exc:  # noqa: BLE001
+        return type(exc), str(exc)
+
+
+class TestFastEncode:
+    """orjson responses must be byte-identical to BridgeCodec's."""
+
+    @pytest.mark.parametrize('value', ENCODE_PAYLOADS, ids=repr)
+    def test_matches_bridge_codec(self, value, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip('orjson')
+        out = {'id': 7, 'result': value}
+        fast = _encode(out)
+        monkeypatch.setattr(python_bridge, '_orjson', None)
+        assert fast == _encode(out)
+
+    def test_plain_payloads_take_the_fast_path(self) -> None:
+        pytest.importorskip('orjson')
+        out = {'id': 1, 'result': {'values': [0.5, 2.25, 3], 'names': ['a', 'b']}}
+        expected = b'{"id":1,"result":{"values":[0.5,2.25,3],"names":["a","b"]}}'
+        assert python_bridge._fast_encode(out) == expected
+
+    @pytest.mark.parametrize(
+        'value',
+        ['é', 1e16, 1e-5, float('nan'), _Color.RED, _Level.HIGH, _Name('x'), {1: 2}, b'x'],
+        ids=repr,
+    )
+    def test_non_plain_values_fall_back(self, value) -> None:
+        assert python_bridge._is_plain_json({'result': [value]}) is False
+
+
+LOADS_INPUTS = [
+    b'{"id":1,"method":"call","params":{"args":[1,2.5,"x"],"kwargs":{}}}',
+    b'{"a":1,"a":2}',
+    b'[NaN,Infinity,-Infinity]',
+    b'"\\ud800"',
+    b'[12345678901234567890,-9223372036854775809]',
+    b'{"digits":"1234567890123456789012"}',
+    b'[1.5e400,-0,1E5,0.1]',
+    '{"text":"é中"}'.encode(),
+    b' [1] ',
+    b'[1,]',
+    b'{"a":',
+    b'',
+]
+
+
+def _loads(data):
+    try:
+        return repr(python_bridge._loads(data))  # repr: NaN compares equal to itself
+    except ValueError as exc:
+        return type(exc), str(exc)
+
+
+class TestLoads:
+    """orjson request parsing must accept, reject and report exactly as json.loads."""
+
+    @pytest.mark.parametrize('data', LOADS_INPUTS, ids=repr)
+    def test_matches_json_loads(self, data: bytes, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip('orjson')
+        parsed = _loads(data)
+        monkeypatch.setattr(python_bridge, '_orjson', None)
+        assert parsed == _loads(data)
+
+    def test_plain_requests_use_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        orjson = pytest.importorskip('orjson')
+        calls = []
+
+        class _Spy:
+            @staticmethod
+            def loads(data):
+                calls.append(data)
+                return orjson.loads(data)
+
+        monkeypatch.setattr(python_bridge, '_orjson', _Spy)
+        assert python_bridge._loads(b'{"id":1}') == {'id': 1}
+        # NaN is rejected by orjson and re-parsed by json.loads.
+        assert repr(python_bridge._loads(b'[NaN]')) == '[nan]'
+        # 19+ digit runs skip orjson entirely.
+        assert python_bridge._loads(b'[12345678901234567890]') == [12345678901234567890]
+        assert calls == [b'{"id":1}', b'[NaN]']
+
+
+def _call_line(req_id: int, function: str, args_json: bytes) -> bytes:
+    return (
+        b'{"id":%d,"protocol":"tywrap/1","method":"call","params":'
+        b'{"module":"math","functionName":"%s","args":%s}}\n'
+        % (req_id, function.encode(), args_json)
+    )
+
+
+def _run_bridge(stdin: bytes, **env: str) -> list[dict]:
+    completed = subprocess.run(
+        [sys.executable, str(RUNTIME_DIR / 'python_bridge.py')],
+        input=stdin,
+        capture_output=True,
+        check=True,
+        env={**os.environ, **env},
+        timeout=60,
+    )
+    return [json.loads(line) for line in completed.stdout.splitlines()]
+
+
+class TestRequestStream:
+    def test_invalid_utf8_error_keeps_request_id(self) -> None:
+        responses = _run_bridge(_call_line(5, 'sqrt', b'["\xff"]') + _call_line(6, 'sqrt', b'[4]'))
+
+        assert responses[0]['id'] == 5
+        assert responses[0]['error']['type'] == 'UnicodeDecodeError'
+        assert responses[1] == {'id': 6, 'protocol': 'tywrap/1', 'result': 2.0}
+
+
+class TestSendTraceback:
+    def test_handler_errors_include_traceback_by_default(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv('TYWRAP_SEND_TRACEBACK', raising=False)
+        [response] = _run_bridge(_call_line(1, 'sqrt', b'[-1]'))
+
+        assert response['error']['type'] == 'ValueError'
+        assert 'Traceback (most recent call last)' in response['error']['traceback']
+
+    def test_disabled_traceback_keeps_type_and_message(self) -> None:
+        [response] = _run_bridge(_call_line(1, 'sqrt', b'[-1]'), TYWRAP_SEND_TRACEBACK='0')
+
+        assert response['id'] == 1
+        assert response['error'] == {'type': 'ValueError', 'message': 'math domain error'}